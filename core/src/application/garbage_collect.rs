@@ -3,6 +3,7 @@
 //! Removes unreferenced blobs from storage to reclaim disk space.
 //! Similar to `git gc` - identifies and prunes orphaned content.
 
+use crate::domain::blob::{blob_path, BLOB_DIR};
 use crate::domain::manifest::Manifest;
 use crate::ports::{PortResult, StoragePort};
 use std::collections::HashSet;
@@ -38,7 +39,7 @@ impl<S: StoragePort> GcUseCase<S> {
         let referenced = self.collect_referenced_hashes(manifest);
         
         // Step 2: List all blobs in storage
-        let all_blobs = self.storage.list(".store/blobs/").await.unwrap_or_default();
+        let all_blobs = self.storage.list(BLOB_DIR).await.unwrap_or_default();
         
         let mut blobs_deleted = 0;
         let mut bytes_freed = 0;
@@ -46,7 +47,7 @@ impl<S: StoragePort> GcUseCase<S> {
         // Step 3: Delete unreferenced blobs
         for blob_name in &all_blobs {
             if !referenced.contains(blob_name) {
-                let blob_path = format!(".store/blobs/{}", blob_name);
+                let blob_path = blob_path(blob_name);
                 
                 // Get size before deletion for reporting
                 if let Ok(size) = self.storage.size(&blob_path).await {
@@ -3,6 +3,7 @@
 //! Restores the working directory to a specific version from history.
 //! Uses reverse delta strategy: applies patches backwards from HEAD.
 
+use crate::domain::blob::blob_path;
 use crate::domain::manifest::{FileType, Manifest};
 use crate::ports::{DiffPort, EncryptionPort, PortResult, StoragePort, PortError};
 use std::collections::{HashMap, HashSet, VecDeque};
@@ -111,15 +112,7 @@ where
             if is_text {
                 // Try reading from blob first (Fast Path / Full History enabled)
                 if let Some(hash) = &target_state.hash {
-                    let mut blob_content = self.storage.read(&format!(".store/blobs/{}", hash)).await?;
-                    
-                    if target_state.encrypted.unwrap_or(false) {
-                         let key = input.encryption_key.as_ref()
-                            .ok_or_else(|| PortError::EncryptionError("Key required for encrypted content".into()))?;
-                         blob_content = self.encryptor.decrypt(key, &blob_content).await?;
-                    }
-                    
-                    self.storage.write(&format!("content/{}", path), &blob_content).await?;
+                    self.restore_blob(path, hash, target_state.encrypted.unwrap_or(false), &input.encryption_key).await?;
                     files_restored += 1;
                 } else {
                      // Fallback to patches if no blob (Legacy/Optimization)
@@ -130,15 +123,7 @@ where
             } else {
                 // For binary files: fetch from CAS
                 if let Some(hash) = &target_state.hash {
-                    let mut blob_content = self.storage.read(&format!(".store/blobs/{}", hash)).await?;
-                    
-                    if target_state.encrypted.unwrap_or(false) {
-                        let key = input.encryption_key.as_ref()
-                            .ok_or_else(|| PortError::EncryptionError("Key required for encrypted content".into()))?;
-                        blob_content = self.encryptor.decrypt(key, &blob_content).await?;
-                    }
-                    
-                    self.storage.write(&format!("content/{}", path), &blob_content).await?;
+                    self.restore_blob(path, hash, target_state.encrypted.unwrap_or(false), &input.encryption_key).await?;
                 }
             }
             files_restored += 1;
@@ -170,6 +155,31 @@ where
         })
     }
 
+    /// Materialize a CAS blob into the working copy
+    ///
+    /// Plain blobs are copied storage-side so backends can avoid buffering;
+    /// encrypted ones have to pass through memory to be decrypted.
+    async fn restore_blob(
+        &self,
+        path: &str,
+        hash: &str,
+        encrypted: bool,
+        encryption_key: &Option<Vec<u8>>,
+    ) -> PortResult<()> {
+        let blob_path = blob_path(hash);
+        let content_path = format!("content/{}", path);
+
+        if !encrypted {
+            return self.storage.copy(&blob_path, &content_path).await;
+        }
+
+        let key = encryption_key.as_ref()
+            .ok_or_else(|| PortError::EncryptionError("Key required for encrypted content".into()))?;
+        let blob_content = self.storage.read(&blob_path).await?;
+        let plaintext = self.encryptor.decrypt(key, &blob_content).await?;
+        self.storage.write(&content_path, &plaintext).await
+    }
+
     /// Find path between two versions in the DAG (BFS)
     fn find_version_path(
         &self,
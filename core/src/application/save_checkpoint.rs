@@ -4,10 +4,11 @@
 //! Implements the Reverse Delta Strategy: HEAD is always full,
 //! history is stored as reverse patches.
 
+use crate::domain::blob::blob_path;
 use crate::domain::manifest::{FileType, Manifest};
 use crate::domain::version::{FileState, Version};
 use crate::ports::{DiffPort, EncryptionPort, HasherPort, PortResult, StoragePort};
-use std::collections::HashMap;
+use std::collections::{HashMap, HashSet};
 
 /// Input for SaveCheckpoint use case
 #[derive(Debug)]
@@ -91,7 +92,9 @@ where
 
         // Step 2: Process text files modifications (generate reverse patches for history)
         // Must run BEFORE process_full_files updates the manifest
-        self.process_text_modifications(manifest, &changes, &version_id, &input.encryption_key).await?;
+        let delta_refs = self
+            .process_text_modifications(manifest, &changes, &version_id, &input.encryption_key)
+            .await?;
 
         // Step 3: Identify files needing full content (all added and modified files)
         self.process_full_files(manifest, &changes, &input.encryption_key).await?;
@@ -103,6 +106,7 @@ where
             &input,
             manifest,
             &changes,
+            &delta_refs,
         );
 
         // Step 5: Update references
@@ -132,10 +136,26 @@ where
         let current_files_set: std::collections::HashSet<_> = 
             current_files.iter().collect();
 
-        // Check for added/modified files
+        // Read the working copy in bounded windows, hashing each window in one
+        // (possibly parallel) pass before reading the next
+        let mut hashes = Vec::with_capacity(current_files.len());
+        let mut window: Vec<Vec<u8>> = Vec::new();
+        let mut window_bytes = 0;
         for file_path in &current_files {
             let content = self.storage.read(&format!("content/{}", file_path)).await?;
-            let current_hash = self.hasher.hash(&content);
+            window_bytes += content.len();
+            window.push(content);
+            if window.len() >= WINDOW_MAX_FILES || window_bytes >= WINDOW_MAX_BYTES {
+                hashes.extend(hash_all(&self.hasher, &window));
+                window.clear();
+                window_bytes = 0;
+            }
+        }
+        hashes.extend(hash_all(&self.hasher, &window));
+        drop(window);
+
+        // Check for added/modified files
+        for (file_path, current_hash) in current_files.iter().zip(hashes) {
 
             if let Some(file_entry) = manifest.file_map.get(file_path) {
                 // File exists in manifest
@@ -182,6 +202,10 @@ where
         changes: &[FileChange],
         encryption_key: &Option<Vec<u8>>,
     ) -> PortResult<()> {
+        // New blobs are persisted in bounded write_many() batches
+        let mut new_blobs: Vec<(String, Vec<u8>)> = Vec::new();
+        let mut new_bytes = 0;
+        let mut queued: HashSet<&str> = HashSet::new();
         for change in changes {
             let (path, hash) = match change {
                 FileChange::Added { path, hash } | FileChange::Modified { path, new_hash: hash, .. } => {
@@ -191,16 +215,22 @@ where
             };
 
             // Check if blob already exists (deduplication!)
-            let blob_path = format!(".store/blobs/{}", hash);
-            if !self.storage.exists(&blob_path).await? {
-                // Read content and save new blob
+            let blob_path = blob_path(hash);
+            if !queued.contains(hash.as_str()) && !self.storage.exists(&blob_path).await? {
+                // Read content and queue new blob
                 let mut content = self.storage.read(&format!("content/{}", path)).await?;
                 
                 if let Some(key) = encryption_key {
                     content = self.encryptor.encrypt(key, &content).await?;
                 }
                 
-                self.storage.write(&blob_path, &content).await?;
+                queued.insert(hash.as_str());
+                new_bytes += content.len();
+                new_blobs.push((blob_path, content));
+                if new_blobs.len() >= WINDOW_MAX_FILES || new_bytes >= WINDOW_MAX_BYTES {
+                    self.storage.write_many(std::mem::take(&mut new_blobs)).await?;
+                    new_bytes = 0;
+                }
             }
             
             // Update file entry hash and encrypted flag
@@ -211,17 +241,24 @@ where
             }
         }
 
+        if !new_blobs.is_empty() {
+            self.storage.write_many(new_blobs).await?;
+        }
         Ok(())
     }
 
     /// Step 2: Generate reverse patches for text file modifications
+    ///
+    /// Returns the patch path written for each file so `create_version`
+    /// can reference it without hashing the path again.
     async fn process_text_modifications(
         &self,
         manifest: &Manifest,
         changes: &[FileChange],
         version_id: &str,
         encryption_key: &Option<Vec<u8>>,
-    ) -> PortResult<()> {
+    ) -> PortResult<HashMap<String, String>> {
+        let mut delta_refs = HashMap::new();
         for change in changes {
             let (path, old_hash) = match change {
                 FileChange::Modified { path, old_hash, .. } => {
@@ -239,7 +276,7 @@ where
 
             // Read OLD content (from blob store using OLD hash)
             // HEAD always points to full blobs
-            let old_blob_path = format!(".store/blobs/{}", old_hash);
+            let old_blob_path = blob_path(old_hash);
             let mut old_content = self.storage.read(&old_blob_path).await?;
             
             // Decrypt OLD content if needed
@@ -267,9 +304,10 @@ where
             }
             
             self.storage.write(&patch_path, &patch_data).await?;
+            delta_refs.insert(path.clone(), patch_path);
         }
 
-        Ok(())
+        Ok(delta_refs)
     }
 
     /// Create Version object from changes
@@ -280,6 +318,7 @@ where
         input: &SaveCheckpointInput,
         manifest: &Manifest,
         changes: &[FileChange],
+        delta_refs: &HashMap<String, String>,
     ) -> Version {
         // Copy parent's file states
         let mut file_states: HashMap<String, FileState> = 
@@ -319,14 +358,9 @@ where
                     state.hash = Some(new_hash.clone());
                     state.encrypted = Some(input.encryption_key.is_some());
                     
-                    // For text files, add content_ref to the patch
-                    let is_text = entry.map(|e| matches!(e.file_type, FileType::Text)).unwrap_or(false);
-                    if is_text {
-                        let path_hash = self.hasher.hash(path.as_bytes());
-                        state.content_ref = Some(format!(
-                            ".store/deltas/{}_{}.patch",
-                            version_id, &path_hash[..16]
-                        ));
+                    // For text files, add content_ref to the patch written in step 2
+                    if let Some(patch_path) = delta_refs.get(path) {
+                        state.content_ref = Some(patch_path.clone());
                     }
                 }
                 FileChange::Deleted { path } => {
@@ -353,6 +387,47 @@ fn chrono_now() -> String {
     chrono::Utc::now().to_rfc3339()
 }
 
+/// Files read (and blobs queued) per window before they are hashed (or
+/// written) and dropped, so a save never holds the whole working copy
+const WINDOW_MAX_FILES: usize = 256;
+const WINDOW_MAX_BYTES: usize = 16 * 1024 * 1024;
+
+/// Below this total size thread spawn overhead outweighs parallel hashing
+#[cfg(not(target_arch = "wasm32"))]
+const PARALLEL_HASH_MIN_BYTES: usize = 1024 * 1024;
+
+/// Hash a batch of blobs, spreading the work over scoped threads on native targets
+#[cfg(not(target_arch = "wasm32"))]
+fn hash_all<H: HasherPort>(hasher: &H, contents: &[Vec<u8>]) -> Vec<String> {
+    let total: usize = contents.iter().map(Vec::len).sum();
+    let threads = std::thread::available_parallelism()
+        .map(|n| n.get())
+        .unwrap_or(1)
+        .min(contents.len());
+
+    if threads <= 1 || total < PARALLEL_HASH_MIN_BYTES {
+        return contents.iter().map(|c| hasher.hash(c)).collect();
+    }
+
+    let chunk_size = (contents.len() + threads - 1) / threads;
+    std::thread::scope(|scope| {
+        let workers: Vec<_> = contents
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(move || chunk.iter().map(|c| hasher.hash(c)).collect::<Vec<_>>()))
+            .collect();
+        workers
+            .into_iter()
+            .flat_map(|w| w.join().expect("hash worker panicked"))
+            .collect()
+    })
+}
+
+/// Hash a batch of blobs (wasm32 has no threads)
+#[cfg(target_arch = "wasm32")]
+fn hash_all<H: HasherPort>(hasher: &H, contents: &[Vec<u8>]) -> Vec<String> {
+    contents.iter().map(|c| hasher.hash(c)).collect()
+}
+
 fn count_changes(changes: &[FileChange]) -> (usize, usize, usize) {
     let mut added = 0;
     let mut modified = 0;
@@ -373,6 +448,66 @@ fn count_changes(changes: &[FileChange]) -> (usize, usize, usize) {
 mod tests {
     use super::*;
 
+    use crate::domain::manifest::ProjectMetadata;
+    use crate::infrastructure::aes_encryptor::AesGcmEncryptor;
+    use crate::infrastructure::memory_storage::MemoryStorage;
+    use crate::infrastructure::sha256_hasher::Sha256Hasher;
+    use crate::infrastructure::simple_diff::SimpleDiff;
+    use std::sync::Arc;
+
     // Tests would use mock implementations of ports
     // See infrastructure/memory_storage.rs for in-memory adapter
+
+    #[test]
+    fn test_hash_all_preserves_order() {
+        let hasher = Sha256Hasher::new();
+        // Large enough to take the parallel path on multi-core hosts
+        let contents: Vec<Vec<u8>> = (0..8u8).map(|i| vec![i; 512 * 1024]).collect();
+
+        let expected: Vec<String> = contents.iter().map(|c| hasher.hash(c)).collect();
+        assert_eq!(hash_all(&hasher, &contents), expected);
+    }
+
+    #[tokio::test]
+    async fn test_identify_changes_hashes_across_windows() {
+        let storage = Arc::new(MemoryStorage::new());
+        // More files than one window holds, so several windows are hashed
+        for i in 0..WINDOW_MAX_FILES + 10 {
+            storage.write(&format!("content/f{}", i), format!("file {}", i).as_bytes()).await.unwrap();
+        }
+        let manifest = Manifest {
+            format_version: "1.0.0".to_string(),
+            metadata: ProjectMetadata {
+                name: "Test".to_string(),
+                description: None,
+                created: "2024-01-01".to_string(),
+                last_modified: "2024-01-01".to_string(),
+                author: None,
+            },
+            file_map: HashMap::new(),
+            version_history: vec![],
+            refs: HashMap::new(),
+            rename_log: vec![],
+        };
+        let use_case = SaveCheckpointUseCase::new(
+            storage.clone(),
+            SimpleDiff::new(),
+            Sha256Hasher::new(),
+            AesGcmEncryptor::new(),
+        );
+
+        let changes = use_case.identify_changes(&manifest).await.unwrap();
+
+        let hasher = Sha256Hasher::new();
+        assert_eq!(changes.len(), WINDOW_MAX_FILES + 10);
+        for change in &changes {
+            match change {
+                FileChange::Added { path, hash } => {
+                    let content = storage.read(&format!("content/{}", path)).await.unwrap();
+                    assert_eq!(hash, &hasher.hash(&content));
+                }
+                other => panic!("unexpected change {:?}", other),
+            }
+        }
+    }
 }
@@ -1,6 +1,19 @@
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 
+/// Directory holding content-addressed blobs
+///
+/// The layout is flat (`.store/blobs/{hash}`): it is shared with the
+/// TypeScript bindings and with exported `.jcf` archives, so sharding it
+/// (git-style `ab/cdef...` fanout) is a format change. Build paths through
+/// [`blob_path`] so that change stays in one place.
+pub const BLOB_DIR: &str = ".store/blobs/";
+
+/// Storage path of the blob with the given content hash
+pub fn blob_path(hash: &str) -> String {
+    format!("{}{}", BLOB_DIR, hash)
+}
+
 #[derive(Debug, Serialize, Deserialize)]
 pub struct Blob {
     pub hash: String,
@@ -87,6 +87,16 @@ impl StoragePort for MemoryStorage {
             .map(|d| d.len())
             .ok_or_else(|| PortError::NotFound(path.to_string()))
     }
+
+    async fn copy(&self, from: &str, to: &str) -> PortResult<()> {
+        let mut files = self.files.write().unwrap();
+        let data = files
+            .get(from)
+            .cloned()
+            .ok_or_else(|| PortError::NotFound(from.to_string()))?;
+        files.insert(to.to_string(), data);
+        Ok(())
+    }
 }
 
 #[cfg(test)]
@@ -125,4 +135,15 @@ mod tests {
         assert!(files.contains(&"file1.txt".to_string()));
         assert!(files.contains(&"file2.txt".to_string()));
     }
+
+    #[tokio::test]
+    async fn test_memory_storage_copy() {
+        let storage = MemoryStorage::new();
+        
+        storage.write(".store/blobs/abc", b"blob").await.unwrap();
+        storage.copy(".store/blobs/abc", "content/file.bin").await.unwrap();
+        
+        assert_eq!(storage.read("content/file.bin").await.unwrap(), b"blob");
+        assert!(storage.copy("missing", "content/other.bin").await.is_err());
+    }
 }
@@ -1,11 +1,20 @@
 //! # SHA-256 Hasher Adapter
 //!
 //! Implementation of HasherPort using the `sha2` crate.
+//!
+//! `sha2` dispatches to the SHA-NI / ARMv8 SHA2 instructions at runtime
+//! when the CPU supports them, so blob names stay SHA-256 (the format
+//! every store and `verify_integrity` expects) without a software-only
+//! hashing path on modern hardware.
 
 use crate::ports::{HasherPort, PortResult};
 use sha2::{Digest, Sha256};
 use std::io::Read;
 
+/// Read buffer size for `hash_stream` (large enough to keep the
+/// block compression loop busy between `read` calls)
+const STREAM_BUFFER_SIZE: usize = 64 * 1024;
+
 /// SHA-256 hasher implementation
 pub struct Sha256Hasher;
 
@@ -25,16 +34,13 @@ impl HasherPort for Sha256Hasher {
     /// Compute SHA-256 hash of data
     /// Returns lowercase hex string (64 chars)
     fn hash(&self, data: &[u8]) -> String {
-        let mut hasher = Sha256::new();
-        hasher.update(data);
-        let result = hasher.finalize();
-        hex_encode(&result)
+        hex_encode(&Sha256::digest(data))
     }
 
     /// Compute hash from stream (for large files)
     fn hash_stream(&self, reader: &mut dyn Read) -> PortResult<String> {
         let mut hasher = Sha256::new();
-        let mut buffer = [0u8; 8192];
+        let mut buffer = vec![0u8; STREAM_BUFFER_SIZE];
         
         loop {
             let bytes_read = reader.read(&mut buffer)?;
@@ -51,7 +57,13 @@ impl HasherPort for Sha256Hasher {
 
 /// Convert bytes to lowercase hex string
 fn hex_encode(bytes: &[u8]) -> String {
-    bytes.iter().map(|b| format!("{:02x}", b)).collect()
+    const HEX: &[u8; 16] = b"0123456789abcdef";
+    let mut out = String::with_capacity(bytes.len() * 2);
+    for &b in bytes {
+        out.push(HEX[(b >> 4) as usize] as char);
+        out.push(HEX[(b & 0x0f) as usize] as char);
+    }
+    out
 }
 
 #[cfg(test)]
@@ -101,4 +113,15 @@ mod tests {
         // SHA-256 produces 64 character hex string
         assert_eq!(hash.len(), 64);
     }
+
+    #[test]
+    fn test_hash_stream_matches_hash() {
+        let hasher = Sha256Hasher::new();
+        // Spans several read buffers to exercise chunk boundaries
+        let data: Vec<u8> = (0..STREAM_BUFFER_SIZE * 3 + 17).map(|i| (i % 251) as u8).collect();
+
+        let streamed = hasher.hash_stream(&mut data.as_slice()).unwrap();
+
+        assert_eq!(streamed, hasher.hash(&data));
+    }
 }
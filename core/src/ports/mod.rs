@@ -82,6 +82,26 @@ pub trait StoragePort: Send + Sync {
         let data: Vec<u8> = chunks.into_iter().flatten().collect();
         self.write(path, &data).await
     }
+
+    /// Write several files in one call
+    ///
+    /// Default implementation calls `write()` for each item.
+    /// Backends with per-call overhead (e.g. a foreign-language bridge) should override it.
+    async fn write_many(&self, items: Vec<(String, Vec<u8>)>) -> PortResult<()> {
+        for (path, data) in &items {
+            self.write(path, data).await?;
+        }
+        Ok(())
+    }
+
+    /// Copy a file within the storage
+    ///
+    /// Default implementation round-trips through `read()`/`write()`.
+    /// Backends that can copy without buffering (e.g. `sendfile`) should override it.
+    async fn copy(&self, from: &str, to: &str) -> PortResult<()> {
+        let data = self.read(from).await?;
+        self.write(to, &data).await
+    }
 }
 
 #[cfg_attr(not(target_arch = "wasm32"), async_trait)]
@@ -126,6 +146,14 @@ impl<S: StoragePort + ?Sized> StoragePort for std::sync::Arc<S> {
     ) -> PortResult<()> {
         (**self).write_chunked(path, chunks).await
     }
+
+    async fn write_many(&self, items: Vec<(String, Vec<u8>)>) -> PortResult<()> {
+        (**self).write_many(items).await
+    }
+
+    async fn copy(&self, from: &str, to: &str) -> PortResult<()> {
+        (**self).copy(from, to).await
+    }
 }
 
 /// Diff Port - text diffing and patching
@@ -9,22 +9,13 @@ Demonstrates the core lifecycle:
 - restore_version()
 """
 
-import os
-import shutil
-from kamaros import JCFManager, FileAdapter
+from kamaros import JCFManager
+from _example_utils import make_adapter
 
 PROJECT_STORE = "/tmp/kamaros-example-01"
 
 
-def cleanup():
-    if os.path.exists(PROJECT_STORE):
-        shutil.rmtree(PROJECT_STORE)
-    os.makedirs(PROJECT_STORE)
-
-
 def main():
-    cleanup()
-    
     print("=" * 50)
     print("Example 01: Basic Workflow")
     print("=" * 50)
@@ -32,7 +23,7 @@ def main():
     print(f"Storage path: {PROJECT_STORE}")
 
     # 1. Initialize Manager
-    adapter = FileAdapter(PROJECT_STORE)
+    adapter = make_adapter(PROJECT_STORE)
     manager = JCFManager(adapter)
     
     # 2. Create Project
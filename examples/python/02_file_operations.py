@@ -10,27 +10,18 @@ Demonstrates file management functions:
 - rename_file()
 """
 
-import os
-import shutil
-from kamaros import JCFManager, FileAdapter
+from kamaros import JCFManager
+from _example_utils import make_adapter
 
 PROJECT_STORE = "/tmp/kamaros-example-02"
 
 
-def cleanup():
-    if os.path.exists(PROJECT_STORE):
-        shutil.rmtree(PROJECT_STORE)
-    os.makedirs(PROJECT_STORE)
-
-
 def main():
-    cleanup()
-    
     print("=" * 50)
     print("Example 02: File Operations")
     print("=" * 50)
     
-    adapter = FileAdapter(PROJECT_STORE)
+    adapter = make_adapter(PROJECT_STORE)
     manager = JCFManager(adapter)
     manager.create_project("FileOpsDemo")
     
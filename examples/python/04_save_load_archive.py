@@ -11,16 +11,14 @@ Demonstrates archive operations:
 import os
 import shutil
 from kamaros import JCFManager, FileAdapter
+from _example_utils import clone_store, reset_store
 
 PROJECT_STORE = "/tmp/kamaros-example-04"
 PROJECT_STORE_2 = "/tmp/kamaros-example-04-loaded"
 
 
 def cleanup():
-    for path in [PROJECT_STORE, PROJECT_STORE_2]:
-        if os.path.exists(path):
-            shutil.rmtree(path)
-        os.makedirs(path)
+    reset_store(PROJECT_STORE, PROJECT_STORE_2)
 
 
 def main():
@@ -59,7 +57,7 @@ def main():
     
     # Copy archive and blobs to new location
     shutil.copy(archive_path, os.path.join(PROJECT_STORE_2, "project.jcf"))
-    shutil.copytree(
+    clone_store(
         os.path.join(PROJECT_STORE, ".store"),
         os.path.join(PROJECT_STORE_2, ".store")
     )
@@ -16,7 +16,9 @@ Full workflow demonstrating:
 import os
 import shutil
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from kamaros import JCFManager, FileAdapter
+from _example_utils import clone_store, remove_store, reset_store
 
 # === Configuration ===
 PROJECT_STORE = "/tmp/kamaros-example-05"
@@ -31,12 +33,16 @@ def download_image(url: str) -> bytes:
         return response.read()
 
 
+def download_images(*urls: str) -> list:
+    """Download several images concurrently; results keep the order of urls."""
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        return list(pool.map(download_image, urls))
+
+
 def cleanup():
     """Remove previous demo artifacts."""
-    for path in [PROJECT_STORE, PROJECT_STORE_LOADED]:
-        if os.path.exists(path):
-            shutil.rmtree(path)
-    os.makedirs(PROJECT_STORE)
+    remove_store(PROJECT_STORE_LOADED)
+    reset_store(PROJECT_STORE)
 
 
 def print_separator(title: str):
@@ -94,8 +100,10 @@ Album demonstracyjny dla biblioteki Kamaros.
     
     # Download and add images from picsum.photos (random images)
     print("  Pobieranie obrazów z internetu...")
-    photo1 = download_image("https://picsum.photos/seed/kamaros1/400/300.jpg")
-    photo2 = download_image("https://picsum.photos/seed/kamaros2/400/300.jpg")
+    photo1, photo2 = download_images(
+        "https://picsum.photos/seed/kamaros1/400/300.jpg",
+        "https://picsum.photos/seed/kamaros2/400/300.jpg",
+    )
     
     manager.add_file("images/photo1.jpg", photo1)
     manager.add_file("images/photo2.jpg", photo2)
@@ -126,13 +134,15 @@ Album demonstracyjny dla biblioteki Kamaros.
     manager.add_file("README.md", readme_v2)
     print("  Zmodyfikowano: README.md")
     
-    # Download different version of photo1 (simulate edit)
-    photo1_modified = download_image("https://picsum.photos/seed/kamaros1mod/400/300.jpg")
+    # Download a different version of photo1 (simulate edit) and a new photo
+    photo1_modified, photo3 = download_images(
+        "https://picsum.photos/seed/kamaros1mod/400/300.jpg",
+        "https://picsum.photos/seed/kamaros3/400/300.jpg",
+    )
     manager.add_file("images/photo1.jpg", photo1_modified)
     print(f"  Zmodyfikowano: images/photo1.jpg ({len(photo1_modified)} bytes)")
     
     # Add new photo
-    photo3 = download_image("https://picsum.photos/seed/kamaros3/400/300.jpg")
     manager.add_file("images/photo3.jpg", photo3)
     print(f"  Dodano: images/photo3.jpg ({len(photo3)} bytes)")
     
@@ -181,7 +191,7 @@ Album demonstracyjny dla biblioteki Kamaros.
     if os.path.exists(store_src):
         if os.path.exists(store_dst):
             shutil.rmtree(store_dst)
-        shutil.copytree(store_src, store_dst)
+        clone_store(store_src, store_dst)
     
     manager2.load(JCF_ARCHIVE)
     print(f"  Wczytano: {JCF_ARCHIVE}")
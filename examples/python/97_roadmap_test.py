@@ -5,17 +5,14 @@ Example 97: Roadmap Features Test
 Tests new roadmap features: tag_version, get_version_by_tag, verify_integrity.
 """
 
-import os
-import shutil
 from kamaros import JCFManager, FileAdapter
+from _example_utils import reset_store
 
 STORE = "/tmp/kamaros-test-roadmap"
 
 
 def cleanup():
-    if os.path.exists(STORE):
-        shutil.rmtree(STORE)
-    os.makedirs(STORE)
+    reset_store(STORE)
 
 
 def main():
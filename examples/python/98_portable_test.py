@@ -10,6 +10,7 @@ without manually copying the .store directory.
 import os
 import shutil
 from kamaros import JCFManager, FileAdapter
+from _example_utils import reset_store
 
 STORE_ORIGIN = "/tmp/kamaros-test-portable-origin"
 STORE_DEST = "/tmp/kamaros-test-portable-dest"
@@ -17,11 +18,7 @@ ARCHIVE_NAME = "portable.jcf"
 
 
 def cleanup():
-    for path in [STORE_ORIGIN, STORE_DEST]:
-        if os.path.exists(path):
-            shutil.rmtree(path)
-    os.makedirs(STORE_ORIGIN)
-    os.makedirs(STORE_DEST)
+    reset_store(STORE_ORIGIN, STORE_DEST)
 
 
 def main():
@@ -10,22 +10,23 @@ import os
 import shutil
 import urllib.request
 from kamaros import JCFManager, FileAdapter
+from _example_utils import clone_store, remove_store, reset_store
 
 # === Configuration ===
 PROJECT_STORE = "/tmp/kamaros-example-99"
 PROJECT_STORE_LOADED = "/tmp/kamaros-example-99-loaded"
 
 
-def download_image(url: str) -> bytes:
+def stream_image(url: str, chunk_size: int = 64 * 1024):
+    """Yield the image in chunks as they arrive instead of buffering it first."""
     with urllib.request.urlopen(url, timeout=10) as response:
-        return response.read()
+        while chunk := response.read(chunk_size):
+            yield chunk
 
 
 def cleanup():
-    for path in [PROJECT_STORE, PROJECT_STORE_LOADED]:
-        if os.path.exists(path):
-            shutil.rmtree(path)
-    os.makedirs(PROJECT_STORE)
+    remove_store(PROJECT_STORE_LOADED)
+    reset_store(PROJECT_STORE)
 
 
 def section(title: str):
@@ -60,12 +61,16 @@ def main():
     results.append(("create_project", passed))
     
     # ---
-    section("2. add_file(path, content)")
-    manager.add_file("README.md", b"# Test Project\nVersion 1")
-    manager.add_file("src/main.py", b"print('Hello')")
-    
-    photo = download_image("https://picsum.photos/seed/apitest/200/200.jpg")
-    manager.add_file("images/photo.jpg", photo)
+    section("2. add_files(files) / add_file_stream(path, stream)")
+    manager.add_files({
+        "README.md": b"# Test Project\nVersion 1",
+        "src/main.py": b"print('Hello')",
+    })
+    
+    manager.add_file_stream(
+        "images/photo.jpg",
+        stream_image("https://picsum.photos/seed/apitest/200/200.jpg"),
+    )
     
     passed = len(manager.list_files()) == 3
     test_result("add_file", passed)
@@ -78,6 +83,11 @@ def main():
     test_result("get_file", passed)
     results.append(("get_file", passed))
     
+    contents = manager.get_files(["README.md", "src/main.py", "missing.txt"])
+    passed = contents["src/main.py"] == b"print('Hello')" and contents["missing.txt"] is None
+    test_result("get_files", passed)
+    results.append(("get_files", passed))
+    
     # ---
     section("4. list_files()")
     files = manager.list_files()
@@ -183,7 +193,7 @@ def main():
     section("15. load(path) - import from .jcf")
     os.makedirs(PROJECT_STORE_LOADED, exist_ok=True)
     shutil.copy(archive_path, os.path.join(PROJECT_STORE_LOADED, "project.jcf"))
-    shutil.copytree(os.path.join(PROJECT_STORE, ".store"), os.path.join(PROJECT_STORE_LOADED, ".store"))
+    clone_store(os.path.join(PROJECT_STORE, ".store"), os.path.join(PROJECT_STORE_LOADED, ".store"))
     
     adapter2 = FileAdapter(PROJECT_STORE_LOADED)
     manager2 = JCFManager(adapter2)
@@ -0,0 +1,66 @@
+"""
+Shared helpers for the Python examples.
+"""
+
+import os
+import shutil
+
+from kamaros import FileAdapter, MemoryAdapter
+
+# Set KAMAROS_INMEM=1 to run examples without touching the filesystem
+IN_MEMORY = os.getenv("KAMAROS_INMEM", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def remove_store(*paths: str) -> None:
+    """Remove example store directories, ignoring ones that don't exist."""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def reset_store(*paths: str) -> None:
+    """Recreate example store directories as empty (no existence probe)."""
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def clone_store(src: str, dst: str) -> None:
+    """Copy a .store tree, hardlinking immutable blobs instead of copying them.
+
+    Blobs are content-addressed and never rewritten, so both stores can share
+    the inode. Everything else (manifest, deltas, lock) is copied, because
+    FileAdapter rewrites those files in place.
+    """
+    os.makedirs(dst, exist_ok=True)
+    for entry in os.scandir(src):
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            if entry.name == "blobs":
+                _link_tree(entry.path, target)
+            else:
+                clone_store(entry.path, target)
+        else:
+            shutil.copy2(entry.path, target)
+
+
+def _link_tree(src: str, dst: str) -> None:
+    os.makedirs(dst, exist_ok=True)
+    for entry in os.scandir(src):
+        target = os.path.join(dst, entry.name)
+        if entry.is_dir(follow_symlinks=False):
+            _link_tree(entry.path, target)
+            continue
+        try:
+            os.link(entry.path, target)
+        except FileExistsError:
+            pass
+        except OSError:  # cross-device or no hardlink support
+            shutil.copy2(entry.path, target)
+
+
+def make_adapter(path: str):
+    """FileAdapter on a freshly emptied path, or a MemoryAdapter when KAMAROS_INMEM is set."""
+    if IN_MEMORY:
+        return MemoryAdapter()
+    reset_store(path)
+    return FileAdapter(path)
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Run every Python example in a single interpreter.
+
+Importing kamaros (and initializing the native module) happens once here
+instead of once per script. Examples that spawn worker processes are run
+in a fresh interpreter, since their workers must be importable from
+``__main__``.
+"""
+
+import glob
+import os
+import runpy
+import subprocess
+import sys
+import traceback
+
+import kamaros  # noqa: F401  (pay the import once, up front)
+
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+SUBPROCESS_EXAMPLES = {"06_concurrency_test.py"}
+
+
+def main() -> int:
+    sys.path.insert(0, EXAMPLES_DIR)
+    scripts = sorted(glob.glob(os.path.join(EXAMPLES_DIR, "[0-9][0-9]_*.py")))
+    failed = []
+    
+    for script in scripts:
+        name = os.path.basename(script)
+        print(f"\n>>> {name}")
+        try:
+            if name in SUBPROCESS_EXAMPLES:
+                subprocess.run([sys.executable, script], cwd=EXAMPLES_DIR, check=True)
+            else:
+                runpy.run_path(script, run_name="__main__")
+        except Exception:
+            traceback.print_exc()
+            failed.append(name)
+    
+    print(f"\n{len(scripts) - len(failed)}/{len(scripts)} examples passed")
+    for name in failed:
+        print(f"  FAILED: {name}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,7 +3,7 @@
 //! PyO3 bindings for kamaros-corelib, exposing JCF operations to Python.
 
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyBytes};
+use pyo3::types::{PyDict, PyBytes, PyList};
 use pythonize::{pythonize, depythonize};
 use serde::Serialize;
 use kamaros_corelib::domain::manifest::{Manifest, ProjectMetadata};
@@ -33,7 +33,7 @@ impl StoragePort for PyStorageWrapper {
         Python::with_gil(|py| {
             let res = self.adapter.call_method1(py, "read", (path,))
                 .map_err(|e| PortError::Io(std::io::Error::new(std::io::ErrorKind::Other, format!("Python error: {}", e))))?;
-            let data: Vec<u8> = res.extract(py)
+            let data = extract_bytes(res.bind(py))
                 .map_err(|e| PortError::Io(std::io::Error::new(std::io::ErrorKind::Other, format!("Extract error: {}", e))))?;
             Ok(data)
         })
@@ -48,6 +48,23 @@ impl StoragePort for PyStorageWrapper {
         })
     }
 
+    async fn write_many(&self, items: Vec<(String, Vec<u8>)>) -> PortResult<()> {
+        Python::with_gil(|py| {
+            // One adapter call for the whole batch instead of one per blob
+            let adapter = self.adapter.bind(py);
+            let batch: Vec<(String, Bound<'_, PyBytes>)> = items.iter()
+                .map(|(path, data)| (path.clone(), PyBytes::new_bound(py, data)))
+                .collect();
+            let res = if adapter.hasattr("write_many").unwrap_or(false) {
+                adapter.call_method1("write_many", (PyList::new_bound(py, batch),)).map(|_| ())
+            } else {
+                batch.into_iter().try_for_each(|item| adapter.call_method1("write", item).map(|_| ()))
+            };
+            res.map_err(|e| PortError::Io(std::io::Error::new(std::io::ErrorKind::Other, format!("Python error: {}", e))))?;
+            Ok(())
+        })
+    }
+
     async fn delete(&self, path: &str) -> PortResult<()> {
         Python::with_gil(|py| {
             self.adapter.call_method1(py, "delete", (path,))
@@ -86,12 +103,40 @@ impl StoragePort for PyStorageWrapper {
             } else {
                 let res = self.adapter.call_method1(py, "read", (path,))
                     .map_err(|e| PortError::Io(std::io::Error::new(std::io::ErrorKind::Other, format!("Python error: {}", e))))?;
-                let data: Vec<u8> = res.extract(py)
+                let len = res.bind(py).len()
                     .map_err(|e| PortError::Io(std::io::Error::new(std::io::ErrorKind::Other, format!("Extract error: {}", e))))?;
-                Ok(data.len())
+                Ok(len)
             }
         })
     }
+
+    async fn copy(&self, from: &str, to: &str) -> PortResult<()> {
+        let delegated = Python::with_gil(|py| -> PortResult<bool> {
+            // Adapters without copy() fall back to read() + write()
+            if !self.adapter.bind(py).hasattr("copy").unwrap_or(false) {
+                return Ok(false);
+            }
+            self.adapter.call_method1(py, "copy", (from, to))
+                .map_err(|e| PortError::Io(std::io::Error::new(std::io::ErrorKind::Other, format!("Python error: {}", e))))?;
+            Ok(true)
+        })?;
+        if !delegated {
+            let data = self.read(from).await?;
+            self.write(to, &data).await?;
+        }
+        Ok(())
+    }
+}
+
+/// Copy a Python bytes-like result into a Vec<u8>.
+///
+/// `bytes` is copied with a single memcpy; PyO3's generic Vec<u8> extraction
+/// walks it as a sequence of ints. Other buffer types keep the generic path.
+fn extract_bytes(obj: &Bound<'_, PyAny>) -> PyResult<Vec<u8>> {
+    if let Ok(bytes) = obj.downcast::<PyBytes>() {
+        return Ok(bytes.as_bytes().to_vec());
+    }
+    obj.extract()
 }
 
 // In PyO3, we must mark our Wrapper as Send/Sync since it will be used in async traits
@@ -186,16 +231,28 @@ fn save_checkpoint(
     let mut rust_manifest: Manifest = depythonize(manifest)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Parse manifest error: {}", e)))?;
     
-    let storage = PyStorageWrapper::new(adapter.clone_ref(py));
-    
     // Sync working_dir to storage first (under content/)
     // This allows the use case to identify changes correctly.
+    // bytes objects go to the adapter as one write_many() batch, with no copy
+    // through Rust; other buffers (bytearray, ...) are copied into fresh bytes
+    // so the adapter never stores an object the caller can still mutate.
+    let mut items = Vec::with_capacity(working_dir.len());
     for (key, val) in working_dir {
         let path: String = key.extract()?;
-        let data: Vec<u8> = val.extract()?;
-        futures::executor::block_on(storage.write(&format!("content/{}", path), &data))
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Storage write error: {}", e)))?;
+        let data = if val.downcast::<PyBytes>().is_ok() {
+            val
+        } else {
+            PyBytes::new_bound(py, &extract_bytes(&val)?).into_any()
+        };
+        items.push((format!("content/{}", path), data));
     }
+    let py_adapter = adapter.bind(py);
+    let synced = if py_adapter.hasattr("write_many")? {
+        py_adapter.call_method1("write_many", (PyList::new_bound(py, items),)).map(|_| ())
+    } else {
+        items.into_iter().try_for_each(|item| py_adapter.call_method1("write", item).map(|_| ()))
+    };
+    synced.map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Storage write error: {}", e)))?;
 
     let input = SaveCheckpointInput {
         message: message.to_string(),
@@ -292,11 +349,12 @@ fn gc(
 
 /// Derive key from passphrase
 #[pyfunction]
-fn derive_key(passphrase: &str, salt: &[u8]) -> PyResult<Vec<u8>> {
+fn derive_key<'py>(py: Python<'py>, passphrase: &str, salt: &[u8]) -> PyResult<Bound<'py, PyBytes>> {
     let encryptor = AesGcmEncryptor::new();
     let key = encryptor.derive_key(passphrase, salt)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(format!("Derive key error: {}", e)))?;
-    Ok(key)
+    // bytes, not the list[int] a Vec<u8> return would convert to
+    Ok(PyBytes::new_bound(py, &key))
 }
 
 /// Kamaros Python module
@@ -2,18 +2,137 @@
 Storage adapters for Kamaros
 """
 
+import contextlib
+import io
+import itertools
+import mmap
 import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
 
 from .manager import StorageAdapter
 
 
+class _MappedFile(io.RawIOBase):
+    """Read-only file object over an mmap (zipfile needs ``seekable()``)."""
+
+    def __init__(self, mapping: mmap.mmap):
+        self._mapping = mapping
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mapping.read(size)
+
+    def readinto(self, buffer) -> int:
+        # Copy straight out of the mapping, no intermediate bytes object
+        pos = self._mapping.tell()
+        n = min(len(buffer), len(self._mapping) - pos)
+        with memoryview(self._mapping) as view:
+            buffer[:n] = view[pos:pos + n]
+        self._mapping.seek(pos + n)
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._mapping.seek(offset, whence)
+        return self._mapping.tell()
+
+    def tell(self) -> int:
+        return self._mapping.tell()
+
+    def close(self) -> None:
+        if not self.closed:
+            self._mapping.close()
+        super().close()
+
+
+_BLOB_PREFIX = ".store/blobs/"
+_WRITE_WORKERS = 8
+
+
+def _tmp_sibling(full_path: Path) -> Path:
+    """Per-writer temp name next to full_path (same filesystem for os.replace)."""
+    return full_path.with_name(f".{full_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _link_tmpfile(full_path: Path, data: bytes) -> bool:
+    """Write into an anonymous O_TMPFILE inode and linkat() it into place."""
+    dir_fd = os.open(full_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        try:
+            fd = os.open(".", os.O_TMPFILE | os.O_WRONLY, 0o644, dir_fd=dir_fd)
+        except OSError:
+            return False  # filesystem without O_TMPFILE support
+        try:
+            _write_all(fd, data)
+            # dst_dir_fd makes CPython use linkat(AT_SYMLINK_FOLLOW), which
+            # resolves the /proc magic link to the anonymous inode
+            try:
+                os.link(f"/proc/self/fd/{fd}", full_path.name, dst_dir_fd=dir_fd)
+            except FileExistsError:
+                # linkat() cannot replace: link under a temp name, then rename over
+                tmp_path = _tmp_sibling(full_path)
+                os.link(f"/proc/self/fd/{fd}", tmp_path.name, dst_dir_fd=dir_fd)
+                try:
+                    os.replace(tmp_path, full_path)
+                except BaseException:
+                    tmp_path.unlink(missing_ok=True)
+                    raise
+        except OSError:
+            return False  # e.g. /proc not mounted
+        finally:
+            os.close(fd)
+        return True
+    finally:
+        os.close(dir_fd)
+
+
+def _write_blob_atomic(full_path: Path, data: bytes) -> None:
+    """
+    Publish a content-addressed blob so readers never see a partial file.
+    
+    An existing blob is replaced, not trusted: it may be torn or truncated,
+    and rewriting it is how load() repairs a size mismatch. Racing writers
+    hold the same bytes, so whichever rename lands last is fine. No fsync: a
+    torn blob after a crash is caught by verify_integrity.
+    """
+    if getattr(os, "O_TMPFILE", None) is not None and _link_tmpfile(full_path, data):
+        return
+    
+    tmp_path = _tmp_sibling(full_path)
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, full_path)
+
+
 class MemoryAdapter(StorageAdapter):
     """In-memory storage adapter for testing."""
     
     def __init__(self):
         self._storage: Dict[str, bytes] = {}
+        # blob names, kept in step with _storage so list_blobs skips the scan
+        self._blobs: Dict[str, None] = {}
+        self._manifest_lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        self._write_counter = itertools.count(1)
     
     def read(self, path: str) -> bytes:
         if path not in self._storage:
@@ -22,10 +141,28 @@ class MemoryAdapter(StorageAdapter):
     
     def write(self, path: str, data: bytes) -> None:
         self._storage[path] = data
+        self._generations[path] = next(self._write_counter)
+        if path.startswith(_BLOB_PREFIX):
+            self._blobs[path[len(_BLOB_PREFIX):]] = None
+
+    def write_many(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        """Store the whole batch with one dict update per index."""
+        items = dict(items)
+        self._storage.update(items)
+        self._generations.update(zip(items, self._write_counter))
+        self._blobs.update(dict.fromkeys(
+            path[len(_BLOB_PREFIX):] for path in items if path.startswith(_BLOB_PREFIX)))
+
+    def copy(self, src: str, dst: str) -> None:
+        # bytes are immutable, so both keys can share one object
+        self.write(dst, self.read(src))
     
     def delete(self, path: str) -> None:
         if path in self._storage:
             del self._storage[path]
+            self._generations.pop(path, None)
+            if path.startswith(_BLOB_PREFIX):
+                self._blobs.pop(path[len(_BLOB_PREFIX):], None)
     
     def exists(self, path: str) -> bool:
         return path in self._storage
@@ -52,12 +189,22 @@ class MemoryAdapter(StorageAdapter):
 
     def list_blobs(self) -> list:
         """List all blobs in .store/blobs/."""
-        prefix = ".store/blobs/"
-        return [key[len(prefix):] for key in self._storage if key.startswith(prefix)]
+        return list(self._blobs)
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """Serialize manifest updates between managers sharing this adapter."""
+        with self._manifest_lock:
+            yield
+
+    def stat_token(self, path: str) -> Optional[int]:
+        return self._generations.get(path)
 
     def clear(self) -> None:
         """Clear all stored data."""
         self._storage.clear()
+        self._blobs.clear()
+        self._generations.clear()
 
 
 class FileAdapter(StorageAdapter):
@@ -66,15 +213,91 @@ class FileAdapter(StorageAdapter):
     def __init__(self, base_path: str):
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._manifest_lock = threading.Lock()
     
     def read(self, path: str) -> bytes:
         full_path = self.base_path / path
         return full_path.read_bytes()
+
+    def read_many(self, paths: Iterable[str]) -> Dict[str, bytes]:
+        """Read a batch of files on a small thread pool (file I/O releases the GIL)."""
+        paths = list(paths)
+        if len(paths) < 2:
+            return {path: self.read(path) for path in paths}
+        with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, len(paths))) as pool:
+            return dict(zip(paths, pool.map(self.read, paths)))
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Open a file as a memory-mapped stream instead of reading it whole."""
+        full_path = self.base_path / path
+        with open(full_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return io.BytesIO()
+            # The mapping stays valid after the descriptor is closed
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            # Callers (verify_integrity hashing) read front to back: ask for readahead
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+        return _MappedFile(mapping)
+    
+    def open_archive(self, path: str) -> BinaryIO:
+        """
+        Open a file with a plain buffered handle for load().
+        
+        A mapping kept alive by lazily read content faults (SIGBUS) once the
+        file is truncated by a later write; a file handle just reads short.
+        """
+        return open(self.base_path / path, 'rb')
     
     def write(self, path: str, data: bytes) -> None:
         full_path = self.base_path / path
         full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_bytes(data)
+        self._write_file(path, full_path, data)
+    
+    @contextlib.contextmanager
+    def open_write(self, path: str) -> Iterator[BinaryIO]:
+        """Stream into a temp file and atomically replace path on success."""
+        full_path = self.base_path / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = _tmp_sibling(full_path)
+        try:
+            with open(tmp_path, 'wb', buffering=1 << 20) as f:
+                yield f
+            os.replace(tmp_path, full_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
+    def write_many(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        """
+        Write a batch of files, creating each parent directory once.
+        
+        Writes run on a small thread pool (file I/O releases the GIL), which
+        keeps several requests in flight for the device.
+        """
+        jobs = [(path, self.base_path / path, data) for path, data in items]
+        for parent in {full_path.parent for _, full_path, _ in jobs}:
+            parent.mkdir(parents=True, exist_ok=True)
+        
+        if len(jobs) < 2:
+            for job in jobs:
+                self._write_file(*job)
+            return
+        with ThreadPoolExecutor(max_workers=min(_WRITE_WORKERS, len(jobs))) as pool:
+            # list() re-raises the first write error
+            list(pool.map(lambda job: self._write_file(*job), jobs))
+    
+    def _write_file(self, path: str, full_path: Path, data: bytes) -> None:
+        if path.startswith(_BLOB_PREFIX):
+            _write_blob_atomic(full_path, data)
+        else:
+            full_path.write_bytes(data)
+    
+    def copy(self, src: str, dst: str) -> None:
+        """Copy in the kernel (shutil uses sendfile on Linux, fcopyfile on macOS)."""
+        dst_path = self.base_path / dst
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(self.base_path / src, dst_path)
     
     def delete(self, path: str) -> None:
         full_path = self.base_path / path
@@ -85,23 +308,63 @@ class FileAdapter(StorageAdapter):
         return (self.base_path / path).exists()
     
     def list(self, dir: str) -> list:
-        full_path = self.base_path / dir
-        if not full_path.exists():
-            return []
-        # Recursive listing for JCF compatibility
+        root = os.path.join(self.base_path, dir)
+        # Recursive listing for JCF compatibility. scandir's DirEntry reuses
+        # the readdir type info, so no stat or Path object per entry.
         files = []
-        for f in full_path.rglob('*'):
-            if f.is_file():
-                files.append(str(f.relative_to(full_path)))
+        stack = [(root, "")]
+        while stack:
+            current, prefix = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, prefix + entry.name + os.sep))
+                        elif entry.is_file():
+                            files.append(prefix + entry.name)
+            except FileNotFoundError:
+                if current == root:
+                    return []
+                raise
         return files
 
     def size(self, path: str) -> int:
         full_path = self.base_path / path
         return full_path.stat().st_size
 
+    def stat_token(self, path: str) -> Optional[tuple]:
+        """(inode, size, mtime_ns): changes on rewrite or atomic replace."""
+        try:
+            st = os.stat(self.base_path / path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    @contextlib.contextmanager
+    def lock(self) -> Iterator[None]:
+        """
+        Exclusive lock on .store/manifest.lock, shared by all processes using the store.
+        
+        flock() locks belong to the open file description, so each call gets its
+        own descriptor; the thread lock covers platforms without fcntl.
+        """
+        lock_path = self.base_path / ".store" / "manifest.lock"
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._manifest_lock, open(lock_path, 'a+b') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
     def list_blobs(self) -> list:
         """List all blobs in .store/blobs/."""
         blob_path = self.base_path / ".store" / "blobs"
-        if not blob_path.exists():
+        try:
+            # DirEntry.is_file() uses the d_type from readdir, no stat per blob
+            with os.scandir(blob_path) as it:
+                return [entry.name for entry in it if entry.is_file()]
+        except FileNotFoundError:
             return []
-        return [f.name for f in blob_path.iterdir() if f.is_file()]
@@ -2,13 +2,132 @@
 JCFManager - High-level API for JCF file operations
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, BinaryIO, ContextManager, Iterable, Iterator, List, Tuple, Union
+import contextlib
 import zipfile
 import json
 import io
 import os
+import shutil
+import hashlib
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import threading
+import time
+
+# Native entry points are looked up on the package at call time, so the
+# partially initialised package seen here during import is enough
+import kamaros
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+
+_MANIFEST_PATH = ".store/manifest.json"
+# Store entries at least this big are streamed out of the archive on load
+_STREAM_THRESHOLD = 1024 * 1024
+_STREAM_CHUNK = 256 * 1024
+# load() hands small .store entries to write_many in batches of at most this
+# many entries or bytes, so extracting a large store stays bounded in memory
+_WRITE_BATCH_COUNT = 256
+_WRITE_BATCH_BYTES = 16 * 1024 * 1024
+_TEXT_EXTS = frozenset({'txt', 'md', 'json', 'js', 'ts', 'css', 'html', 'xml', 'yaml', 'yml', 'py'})
+# Already-compressed formats: deflating them again costs CPU and saves nothing
+_STORED_EXTS = frozenset({
+    'jpg', 'jpeg', 'png', 'gif', 'webp', 'avif', 'heic',
+    'mp3', 'mp4', 'm4a', 'mov', 'webm', 'ogg', 'opus',
+    'zip', 'gz', 'tgz', 'bz2', 'xz', 'zst', '7z', 'jcf',
+})
+
+
+# Leading bytes of the same formats, for extensionless .store/blobs entries
+_STORED_MAGIC = (
+    b'\xff\xd8\xff', b'\x89PNG', b'GIF8', b'PK\x03\x04', b'\x1f\x8b',
+    b'BZh', b'\xfd7zXZ', b'\x28\xb5\x2f\xfd', b'7z\xbc\xaf', b'OggS', b'ID3',
+)
+
+
+def _zip_compression(path: str) -> int:
+    """ZIP method for an archive entry: stored for compressed formats, else deflate."""
+    i = path.rfind('.')
+    if i != -1 and path[i + 1:].lower() in _STORED_EXTS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _blob_compression(data: bytes) -> int:
+    """ZIP method for a store blob, sniffed from its content."""
+    if data.startswith(_STORED_MAGIC) or data[4:8] == b'ftyp' or (
+            data[:4] == b'RIFF' and data[8:12] == b'WEBP'):
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+
+def _copy_into_zip(zf: zipfile.ZipFile, name: str, src: BinaryIO, size: int,
+                   buffer: bytearray) -> None:
+    """Copy a large file into the archive through a reused chunk buffer."""
+    view = memoryview(buffer)
+    n = src.readinto(buffer)
+    if _blob_compression(bytes(view[:min(n, 16)])) == zipfile.ZIP_STORED:
+        target = zipfile.ZipInfo(name, date_time=time.localtime()[:6])
+        target.compress_type = zipfile.ZIP_STORED
+        target.external_attr = 0o600 << 16
+    else:
+        target = name  # archive default: deflate at the archive's level
+    force_zip64 = size * 1.05 > zipfile.ZIP64_LIMIT
+    with zf.open(target, 'w', force_zip64=force_zip64) as dst:
+        while n:
+            dst.write(view[:n])
+            n = src.readinto(buffer)
+
+
+def _walk_files(root: str, prefix: str) -> Iterator[Tuple[str, str]]:
+    """(absolute path, archive name under prefix) of every file below root."""
+    # scandir's DirEntry reuses the readdir type info, no stat per entry
+    stack = [(root, prefix)]
+    while stack:
+        current, prefix = stack.pop()
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, prefix + entry.name + "/"))
+                elif entry.is_file():
+                    yield entry.path, prefix + entry.name
+
+
+def _sha256_hex(fh: BinaryIO) -> str:
+    """SHA-256 of a binary stream, hashed in chunks rather than read whole."""
+    if isinstance(fh, io.BytesIO):  # getvalue() shares the bytes it was built from
+        return hashlib.sha256(fh.getvalue()).hexdigest()
+    digest = hashlib.sha256()
+    buffer = bytearray(_STREAM_CHUNK)
+    view = memoryview(buffer)
+    n = fh.readinto(buffer)
+    while n:
+        digest.update(view[:n])
+        n = fh.readinto(buffer)
+    return digest.hexdigest()
+
+
+def _dumps_manifest(manifest: Dict[str, Any], pretty: bool = False) -> bytes:
+    """Serialize the manifest to UTF-8 JSON, compact unless pretty (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2 if pretty else None)
+    if pretty:
+        return json.dumps(manifest, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(manifest, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def _loads_manifest(data: bytes) -> Dict[str, Any]:
+    """Parse manifest JSON bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)  # bytes accepted directly, no decode copy
 
 
 def _create_empty_manifest(project_name: str) -> dict:
@@ -28,6 +147,56 @@ def _create_empty_manifest(project_name: str) -> dict:
     }
 
 
+class _BlobCache:
+    """Thread-safe LRU of immutable store objects, bounded by total bytes."""
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+    
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.capacity:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.capacity:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "capacity": self.capacity,
+            }
+
+
 class JCFManager:
     """
     Main class for managing JCF files.
@@ -39,12 +208,41 @@ class JCFManager:
         >>> manager.save("project.jcf")
     """
     
-    def __init__(self, adapter: "StorageAdapter", encryption_key: Optional[bytes] = None):
+    def __init__(self, adapter: "StorageAdapter", encryption_key: Optional[bytes] = None,
+                 cache_size: int = 64 * 1024 * 1024):
         self.adapter = adapter
         self.encryption_key = encryption_key
         self.manifest: Optional[Dict[str, Any]] = None
         self.working_dir: Dict[str, bytes] = {}
         self._lock = threading.Lock()
+        # Store paths are content-addressed (blobs) or version-scoped (deltas),
+        # so cached reads never go stale; only gc() has to drop them.
+        self._blob_cache = _BlobCache(cache_size)
+        # Storage token of the manifest as of our last read/write of it
+        self._manifest_token: Optional[Any] = None
+        # (fileMap paths, renameLog length, tags) of that manifest, so a rebase
+        # can tell our local edits apart from the stored state
+        self._manifest_base: Optional[Tuple[frozenset, int, Dict[str, str]]] = None
+        self._version_index_source: Optional[list] = None
+        self._version_index_len = 0
+        self._version_index_map: Dict[str, Dict[str, Any]] = {}
+        self._file_history_source: Optional[list] = None
+        self._file_history_len = 0
+        self._file_history_map: Dict[str, List[Tuple[int, Optional[str]]]] = {}
+        # Archive opened by load(); content/ entries not yet read into
+        # working_dir stay in _lazy as path -> member name
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._archive_fh: Optional[BinaryIO] = None
+        # Storage path and stat_token of that archive as of load()
+        self._archive_path: Optional[str] = None
+        self._archive_token: Optional[Any] = None
+        self._lazy: Dict[str, str] = {}
+        # Path of the archive last loaded or saved, whether its manifest is
+        # pretty-printed, and whether anything changed through this manager
+        # since then
+        self._saved_path: Optional[str] = None
+        self._saved_pretty = False
+        self._dirty = True
     
     def create_project(self, name: str, description: Optional[str] = None, author: Optional[str] = None) -> None:
         """Create a new empty project."""
@@ -54,55 +252,128 @@ class JCFManager:
         if author:
             self.manifest["metadata"]["author"] = author
         self.working_dir = {}
+        self._close_archive()
         
         # Persist manifest to storage
-        self.adapter.write(".store/manifest.json", json.dumps(self.manifest, indent=2).encode('utf-8'))
+        self._persist_manifest()
     
     def load(self, path: str) -> None:
-        """Load a JCF file from storage."""
-        data = self.adapter.read(path)
+        """
+        Load a JCF file from storage.
         
-        with zipfile.ZipFile(io.BytesIO(data), 'r') as zf:
+        content/ entries are read on first access (get_file, save_checkpoint,
+        ...), so the archive stays open until all of them have been read.
+        If the archive is rewritten by anything other than this manager's
+        save() meanwhile, reading those entries raises RuntimeError; load()
+        it again. A failed load() leaves the current project untouched.
+        """
+        fh = self.adapter.open_archive(path)
+        token = self.adapter.stat_token(path)
+        try:
+            zf = zipfile.ZipFile(fh, 'r')
             # Read manifest
             manifest_data = zf.read("manifest.json")
-            self.manifest = json.loads(manifest_data.decode('utf-8'))
+            manifest = _loads_manifest(manifest_data)
             
-            # Load working directory
-            self.working_dir = {}
-            for name in zf.namelist():
+            # Index working directory
+            lazy = {}
+            store_entries = []
+            batch_bytes = 0
+            for info in zf.infolist():
+                name = info.filename
                 if name.startswith("content/"):
                     relative_path = name[len("content/"):]
                     if relative_path:
-                        self.working_dir[relative_path] = zf.read(name)
+                        lazy[relative_path] = name
+                elif name == _MANIFEST_PATH:
+                    continue  # replaced by the archive's manifest.json below
                 elif name.startswith(".store/"):
-                    # Extract blobs to storage
-                    blob_content = zf.read(name)
-                    # Use adapter to write the blob
-                    # Note: We rely on adapter to handle path creation (like os.makedirs)
-                    # FileAdapter does, MemoryAdapter does.
-                    self.adapter.write(name, blob_content)
+                    # Blobs are content-addressed: one already in storage with
+                    # the same name and size holds these bytes, skip inflating it
+                    if name.startswith(".store/blobs/") and self._has_blob(name, info.file_size):
+                        continue
+                    # Extract blobs to storage; big ones are piped through
+                    # open_write so they are never held in memory whole
+                    if info.file_size >= _STREAM_THRESHOLD:
+                        with zf.open(info) as src, self.adapter.open_write(name) as dst:
+                            shutil.copyfileobj(src, dst, _STREAM_CHUNK)
+                    else:
+                        store_entries.append((name, zf.read(info)))
+                        batch_bytes += info.file_size
+                        # Hand blobs to the adapter in batches so it can batch
+                        # the writes without the whole store in memory
+                        if (len(store_entries) >= _WRITE_BATCH_COUNT
+                                or batch_bytes >= _WRITE_BATCH_BYTES):
+                            self.adapter.write_many(store_entries)
+                            store_entries, batch_bytes = [], 0
+            
+            # Note: We rely on adapter to handle path creation (like os.makedirs)
+            # FileAdapter does, MemoryAdapter does.
+            if store_entries:
+                self.adapter.write_many(store_entries)
+        except BaseException:
+            fh.close()
+            raise
+        
+        self._close_archive()
+        self.manifest = manifest
+        self.working_dir = {}
+        self._archive, self._archive_fh, self._lazy = zf, fh, lazy
+        self._archive_path, self._archive_token = path, token
+        if not lazy:
+            self._close_archive()
+        # The stored copy must be the loaded manifest, or the next checkpoint
+        # would rebase onto whatever .store/manifest.json the archive carried
+        self._persist_manifest()
+        self._saved_path, self._dirty = path, False
+        self._saved_pretty = manifest_data.startswith(b"{\n")  # indented by save(pretty=True)
     
-    def save(self, path: str) -> None:
-        """Save JCF file to storage."""
+    def save(self, path: str, pretty: bool = False, compresslevel: int = 3,
+             force: bool = False) -> None:
+        """
+        Save JCF file to storage.
+        
+        pretty=True indents manifest.json for humans. compresslevel is the
+        zlib level for deflated entries; 3 is several times faster than
+        zlib's default 6 and within a few percent of its size on text;
+        compresslevel=1 trades a few more percent for faster saves still.
+        
+        Saving again to the archive last loaded or saved, with the same
+        pretty setting, is a no-op when nothing changed through this
+        manager's methods since; force=True
+        rewrites it anyway (e.g. after editing manifest/working_dir directly).
+        """
         if self.manifest is None:
             raise ValueError("No project loaded. Call create_project() or load() first.")
         
+        if (not force and not self._dirty and path == self._saved_path
+                and pretty == self._saved_pretty and self.adapter.exists(path)):
+            return
+        if path == self._archive_path:
+            self._materialize()  # the archive we read from is about to be replaced
+        
         # Update timestamp
-        from datetime import datetime
         self.manifest["metadata"]["lastModified"] = datetime.now().isoformat()
         
-        # Create ZIP in memory
-        buffer = io.BytesIO()
-        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        # Stream the ZIP straight into storage
+        with self.adapter.open_write(path) as fh, zipfile.ZipFile(
+                fh, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
             # Write mimetype
             zf.writestr("mimetype", "application/x-jcf")
             
             # Write manifest
-            zf.writestr("manifest.json", json.dumps(self.manifest, indent=2))
+            zf.writestr("manifest.json", _dumps_manifest(self.manifest, pretty))
             
             # Write working directory
             for file_path, data in self.working_dir.items():
-                zf.writestr(f"content/{file_path}", data)
+                zf.writestr(f"content/{file_path}", data,
+                            compress_type=_zip_compression(file_path))
+            # Entries never read since load() go through without being cached
+            if self._lazy:
+                self._check_archive()
+            for file_path, name in self._lazy.items():
+                zf.writestr(f"content/{file_path}", self._archive.read(name),
+                            compress_type=_zip_compression(file_path))
                 
             # Write blob store (for portability)
             # This logic depends on the adapter capabilities. 
@@ -112,53 +383,116 @@ class JCFManager:
             if hasattr(self.adapter, 'base_path'):
                 store_path = os.path.join(self.adapter.base_path, ".store")
                 if os.path.exists(store_path):
-                    for root, _, files in os.walk(store_path):
-                        for file in files:
-                            abs_path = os.path.join(root, file)
-                            rel_path = os.path.relpath(abs_path, self.adapter.base_path)
-                            with open(abs_path, 'rb') as f:
-                                zf.writestr(rel_path, f.read())
-        
-        self.adapter.write(path, buffer.getvalue())
+                    buffer = None  # one chunk buffer reused for every large blob
+                    for abs_path, rel_path in _walk_files(store_path, ".store/"):
+                        if rel_path == ".store/manifest.lock":
+                            continue  # FileAdapter.lock() scratch file
+                        with open(abs_path, 'rb') as f:
+                            size = os.fstat(f.fileno()).st_size
+                            if size < _STREAM_THRESHOLD:
+                                data = f.read()
+                                zf.writestr(rel_path, data, compress_type=_blob_compression(data))
+                                continue
+                            if buffer is None:
+                                buffer = bytearray(_STREAM_CHUNK)
+                            _copy_into_zip(zf, rel_path, f, size, buffer)
+        self._saved_path, self._dirty = path, False
+        self._saved_pretty = pretty
     
     def add_file(self, path: str, content: bytes) -> None:
         """Add or update a file in the working directory."""
+        self.add_files({path: content})
+    
+    def add_file_stream(self, path: str, stream: Union[BinaryIO, Iterable[bytes]],
+                        chunk_size: int = 64 * 1024) -> None:
+        """
+        Add or update a file from a binary stream or an iterable of chunks.
+        
+        Chunks are consumed as they are produced (e.g. straight off a socket)
+        and appended to one buffer whose bytes become the file, so the content
+        is held about once instead of as chunks plus their join. Text chunks
+        (e.g. a stream opened without 'b') raise TypeError.
+        """
+        read = getattr(stream, "read", None)
+        chunks = iter(lambda: read(chunk_size), None) if read is not None else stream
+        buffer = io.BytesIO()
+        for chunk in chunks:
+            if not isinstance(chunk, (bytes, bytearray, memoryview)):
+                raise TypeError(f"add_file_stream() needs bytes chunks, got {type(chunk).__name__}")
+            if not chunk:
+                if read is not None:
+                    break  # any empty read ends the stream
+                continue
+            buffer.write(chunk)
+        # getvalue() hands over BytesIO's own buffer when nothing else holds it
+        self.add_file(path, buffer.getvalue())
+    
+    def add_files(self, files: Union[Mapping, Iterable[Tuple[str, bytes]]]) -> None:
+        """
+        Add or update several files in the working directory at once.
+        
+        Accepts a mapping or any iterable of (path, content) pairs, so a
+        generator can feed files in without building a dict first. All
+        entries share one "modified" timestamp. Content must be bytes; the
+        batch is checked before any of it is applied.
+        """
         with self._lock:
             if self.manifest is None:
                 raise ValueError("No project loaded.")
             
-            self.working_dir[path] = content
-            
             # Update file map
-            from datetime import datetime
-            import uuid
-            
             now = datetime.now().isoformat()
-            if path not in self.manifest["fileMap"]:
-                self.manifest["fileMap"][path] = {
-                    "inodeId": str(uuid.uuid4()),
-                    "type": "text" if self._is_text_file(path) else "binary",
-                    "created": now,
-                    "modified": now,
-                }
-            else:
-                self.manifest["fileMap"][path]["modified"] = now
+            file_map = self.manifest["fileMap"]
+            items = list(files.items() if isinstance(files, Mapping) else files)
+            for path, content in items:
+                if not isinstance(content, bytes):
+                    raise TypeError(f"content of {path!r} must be bytes, not {type(content).__name__}")
+            for path, content in items:
+                if self._lazy.pop(path, None) is not None and not self._lazy:
+                    self._close_archive()
+                if path in file_map and self.working_dir.get(path) == content:
+                    continue  # byte-identical re-add, keep the existing entry
+                self.working_dir[path] = content
+                self._dirty = True
+                if path not in file_map:
+                    file_map[path] = {
+                        "inodeId": str(uuid.uuid4()),
+                        "type": "text" if self._is_text_file(path) else "binary",
+                        "created": now,
+                        "modified": now,
+                    }
+                else:
+                    file_map[path]["modified"] = now
     
     def get_file(self, path: str) -> Optional[bytes]:
         """Get a file from working directory."""
+        self._materialize(path)
         return self.working_dir.get(path)
     
+    def get_files(self, paths: List[str]) -> Dict[str, Optional[bytes]]:
+        """Get several files from working directory (None for missing paths)."""
+        paths = list(paths)
+        for path in paths:
+            self._materialize(path)
+        return {path: self.working_dir.get(path) for path in paths}
+    
     def delete_file(self, path: str) -> bool:
         """Delete a file from working directory."""
+        if self._lazy.pop(path, None) is not None:
+            if not self._lazy:
+                self._close_archive()
+            self._dirty = True
+            return True
         if path in self.working_dir:
             del self.working_dir[path]
+            self._dirty = True
             # save_checkpoint will handle fileMap update
             return True
         return False
     
     def list_files(self) -> list:
         """List all files in working directory."""
-        return list(self.working_dir.keys())
+        return list(self.working_dir.keys()) + list(self._lazy)
     
     def get_manifest(self) -> Optional[Dict[str, Any]]:
         """Get current manifest."""
@@ -167,10 +501,13 @@ class JCFManager:
     
     def load_manifest(self) -> None:
         """Reload project manifest from storage."""
-        with self._lock:
+        with self._lock, self.adapter.lock():
             try:
-                data = self.adapter.read(".store/manifest.json")
-                self.manifest = json.loads(data.decode("utf-8"))
+                data = self.adapter.read(_MANIFEST_PATH)
+                self.manifest = _loads_manifest(data)
+                self._manifest_token = self.adapter.stat_token(_MANIFEST_PATH)
+                self._manifest_base = self._manifest_state(self.manifest)
+                self._dirty = True
             except Exception as e:
                 # If .store/manifest.json doesn't exist, it might be a new project or non-expanded JCF
                 raise RuntimeError(f"Could not load manifest: {e}")
@@ -193,9 +530,9 @@ class JCFManager:
         if self.manifest is None:
             raise ValueError("No project loaded. Call create_project() or load() first.")
             
-        import kamaros
-        
-        with self._lock:
+        self._materialize()
+        with self._lock, self.adapter.lock():
+            self._merge_stored_manifest()
             result = kamaros.save_checkpoint(
                 self.manifest,
                 self.adapter,
@@ -209,10 +546,60 @@ class JCFManager:
             self.manifest = result["manifest"]
             
             # Persist manifest to storage
-            self.adapter.write(".store/manifest.json", json.dumps(self.manifest, indent=2).encode('utf-8'))
+            self._persist_manifest()
             
             return result["version_id"]
 
+    def _merge_stored_manifest(self) -> None:
+        """
+        Rebase the in-memory manifest on the one in storage.
+        
+        Another process may have checkpointed since we loaded, so the stored
+        manifest wins; the edits we made locally since our last read or write
+        of it are replayed on top: fileMap additions and removals (renames are
+        both), new renameLog entries and new tags. Without that baseline (the
+        manifest was assigned directly) only fileMap additions carry over.
+        Skipped when the stored manifest is the one we last read or wrote.
+        Caller must hold the adapter lock.
+        """
+        token = self.adapter.stat_token(_MANIFEST_PATH)
+        if token is not None and token == self._manifest_token:
+            return
+        if not self.adapter.exists(_MANIFEST_PATH):
+            return
+        stored = _loads_manifest(self.adapter.read(_MANIFEST_PATH))
+        stored_state = self._manifest_state(stored)
+        local, base = self.manifest, self._manifest_base
+        for path, entry in local["fileMap"].items():
+            stored["fileMap"].setdefault(path, entry)
+        if base is not None:
+            base_paths, base_renames, base_tags = base
+            for path in base_paths.difference(local["fileMap"]):
+                stored["fileMap"].pop(path, None)
+            stored.setdefault("renameLog", []).extend(local.get("renameLog", [])[base_renames:])
+            local_tags = local.get("refs", {}).get("tags") or {}
+            new_tags = {name: vid for name, vid in local_tags.items() if name not in base_tags}
+            if new_tags:
+                tags = stored.setdefault("refs", {}).setdefault("tags", {})
+                for name, vid in new_tags.items():
+                    tags.setdefault(name, vid)
+        self.manifest = stored
+        self._manifest_token = token
+        self._manifest_base = stored_state
+
+    def _persist_manifest(self) -> None:
+        """Write the manifest to storage and remember its storage token."""
+        self.adapter.write(_MANIFEST_PATH, _dumps_manifest(self.manifest))
+        self._manifest_token = self.adapter.stat_token(_MANIFEST_PATH)
+        self._manifest_base = self._manifest_state(self.manifest)
+        self._dirty = True
+
+    @staticmethod
+    def _manifest_state(manifest: Dict[str, Any]) -> Tuple[frozenset, int, Dict[str, str]]:
+        """The parts of a manifest _merge_stored_manifest diffs local edits against."""
+        tags = manifest.get("refs", {}).get("tags") or {}
+        return frozenset(manifest["fileMap"]), len(manifest.get("renameLog", [])), dict(tags)
+
     def restore_version(self, version_id: str) -> str:
         """
         Restore project to a specific version.
@@ -220,8 +607,6 @@ class JCFManager:
         if self.manifest is None:
             raise ValueError("No project loaded.")
             
-        import kamaros
-        
         result = kamaros.restore_version(
             self.manifest,
             self.adapter,
@@ -239,16 +624,17 @@ class JCFManager:
         # If we use MemoryAdapter, the adapter already has the files.
         # We just need to sync our working_dir.
         
-        self.working_dir = {}
-        # We could list the content/ directory from adapter
-        for name in self.adapter.list("content"):
-             self.working_dir[name] = self.adapter.read(f"content/{name}")
+        self._close_archive()
+        # We could list the content/ directory from adapter; read it in one batch
+        names = self.adapter.list("content")
+        contents = self.adapter.read_many([f"content/{name}" for name in names])
+        self.working_dir = {name: contents[f"content/{name}"] for name in names}
         
         # Update local manifest
         self.manifest = result["manifest"]
         
         # Persist manifest to storage
-        self.adapter.write(".store/manifest.json", json.dumps(self.manifest, indent=2).encode('utf-8'))
+        self._persist_manifest()
         
         return result["restored_version_id"]
 
@@ -257,13 +643,17 @@ class JCFManager:
         if self.manifest is None:
             raise ValueError("No project loaded.")
             
-        import kamaros
         result = kamaros.gc(self.manifest, self.adapter)
+        self._blob_cache.clear()
+        self._dirty = True
         return result
 
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss counters and size of the historical blob read cache."""
+        return self._blob_cache.stats()
+
     def derive_key(self, passphrase: str, salt: bytes) -> bytes:
         """Derive an encryption key from a passphrase."""
-        import kamaros
         key = kamaros.derive_key(passphrase, salt)
         self.encryption_key = bytes(key)
         return self.encryption_key
@@ -278,18 +668,18 @@ class JCFManager:
         if self.manifest is None:
             return None
         
-        for version in self.manifest.get("versionHistory", []):
-            if version["id"] == version_id:
-                return {
-                    "id": version["id"],
-                    "message": version.get("message", ""),
-                    "timestamp": version.get("timestamp", ""),
-                    "author": version.get("author", "unknown"),
-                    "parent_id": version.get("parentId"),
-                    "file_states": version.get("fileStates", {}),
-                    "file_count": len(version.get("fileStates", {})),
-                }
-        return None
+        version = self._version_index().get(version_id)
+        if version is None:
+            return None
+        return {
+            "id": version["id"],
+            "message": version.get("message", ""),
+            "timestamp": version.get("timestamp", ""),
+            "author": version.get("author", "unknown"),
+            "parent_id": version.get("parentId"),
+            "file_states": version.get("fileStates", {}),
+            "file_count": len(version.get("fileStates", {})),
+        }
 
     def get_file_at_version(self, path: str, version_id: str) -> Optional[bytes]:
         """
@@ -305,17 +695,17 @@ class JCFManager:
         if self.manifest is None:
             return None
         
-        # Find version
-        version_info = self.get_version_info(version_id)
-        if version_info is None:
+        # Find version; fileStates holds the full effective file set, so no
+        # walk along the parent chain is needed
+        version = self._version_index().get(version_id)
+        if version is None:
             return None
         
-        file_states = version_info.get("file_states", {})
-        if path not in file_states:
+        file_state = version.get("fileStates", {}).get(path)
+        if file_state is None:
             return None
         
         # Get blob reference (Rust uses contentRef, not blobRef)
-        file_state = file_states[path]
         blob_ref = file_state.get("contentRef")
         if not blob_ref:
             # Fallback to blobRef for compatibility
@@ -326,11 +716,17 @@ class JCFManager:
         # Add .store prefix if needed
         full_path = f".store/{blob_ref}" if not blob_ref.startswith(".store") else blob_ref
         
+        cached = self._blob_cache.get(full_path)
+        if cached is not None:
+            return cached
+        
         # Read blob from storage
         try:
-            return self.adapter.read(full_path)
+            data = self.adapter.read(full_path)
         except Exception:
             return None
+        self._blob_cache.put(full_path, data)
+        return data
 
     def rename_file(self, old_path: str, new_path: str) -> bool:
         """
@@ -344,10 +740,11 @@ class JCFManager:
         if self.manifest is None:
             return False
         
+        self._materialize(old_path)
         if old_path not in self.working_dir:
             return False
         
-        if new_path in self.working_dir:
+        if new_path in self.working_dir or new_path in self._lazy:
             return False  # Target exists
         
         # Move content
@@ -370,6 +767,7 @@ class JCFManager:
             "timestamp": datetime.now().isoformat(),
             "versionId": "",  # Will be updated on next save_checkpoint
         })
+        self._dirty = True
         
         return True
 
@@ -383,34 +781,36 @@ class JCFManager:
         if self.manifest is None:
             return []
         
+        versions = self.manifest.get("versionHistory", [])
         history = []
         previous_blob = None
+        previous_pos = None
         
-        for version in self.manifest.get("versionHistory", []):
-            file_states = version.get("fileStates", {})
-            if path in file_states:
-                current_blob = file_states[path].get("contentRef") or file_states[path].get("blobRef")
-                
-                # Check if file changed
-                if current_blob != previous_blob:
-                    history.append({
-                        "version_id": version["id"],
-                        "message": version.get("message", ""),
-                        "timestamp": version.get("timestamp", ""),
-                        "action": "created" if previous_blob is None else "modified",
-                        "blob_ref": current_blob,
-                    })
-                    previous_blob = current_blob
-            elif previous_blob is not None:
-                # File was deleted in this version
-                history.append({
-                    "version_id": version["id"],
-                    "message": version.get("message", ""),
-                    "timestamp": version.get("timestamp", ""),
-                    "action": "deleted",
-                    "blob_ref": None,
-                })
+        def entry(pos: int, action: str, blob_ref: Optional[str]) -> Dict[str, Any]:
+            version = versions[pos]
+            return {
+                "version_id": version["id"],
+                "message": version.get("message", ""),
+                "timestamp": version.get("timestamp", ""),
+                "action": action,
+                "blob_ref": blob_ref,
+            }
+        
+        # Only the versions that contain path; a gap in positions means the
+        # file was absent (deleted) in the version right after its last one
+        for pos, current_blob in self._file_history_index().get(path, ()):
+            if previous_pos is not None and pos != previous_pos + 1 and previous_blob is not None:
+                history.append(entry(previous_pos + 1, "deleted", None))
                 previous_blob = None
+            
+            # Check if file changed
+            if current_blob != previous_blob:
+                history.append(entry(pos, "created" if previous_blob is None else "modified", current_blob))
+                previous_blob = current_blob
+            previous_pos = pos
+        
+        if previous_pos is not None and previous_pos + 1 < len(versions) and previous_blob is not None:
+            history.append(entry(previous_pos + 1, "deleted", None))
         
         return history
 
@@ -434,26 +834,19 @@ class JCFManager:
         if v1_info is None or v2_info is None:
             return {"error": "Version not found"}
         
-        v1_files = v1_info.get("file_states", {})
-        v2_files = v2_info.get("file_states", {})
-        
-        v1_paths = set(v1_files.keys())
-        v2_paths = set(v2_files.keys())
-        
-        added = list(v2_paths - v1_paths)
-        removed = list(v1_paths - v2_paths)
-        common = v1_paths & v2_paths
+        # path -> blob ref for each side, built once
+        v1_blobs = {p: s.get("contentRef") or s.get("blobRef")
+                    for p, s in v1_info.get("file_states", {}).items()}
+        v2_blobs = {p: s.get("contentRef") or s.get("blobRef")
+                    for p, s in v2_info.get("file_states", {}).items()}
         
-        modified = []
-        unchanged = []
+        added = list(v2_blobs.keys() - v1_blobs.keys())
+        removed = list(v1_blobs.keys() - v2_blobs.keys())
+        common = v1_blobs.keys() & v2_blobs.keys()
         
-        for path in common:
-            v1_blob = v1_files[path].get("contentRef") or v1_files[path].get("blobRef")
-            v2_blob = v2_files[path].get("contentRef") or v2_files[path].get("blobRef")
-            if v1_blob != v2_blob:
-                modified.append(path)
-            else:
-                unchanged.append(path)
+        # (path, blob) pairs present on both sides are the unchanged files
+        unchanged = [path for path, _ in v1_blobs.items() & v2_blobs.items()]
+        modified = list(common.difference(unchanged))
         
         return {
             "v1_id": v1_id,
@@ -484,10 +877,7 @@ class JCFManager:
             return False
         
         # Verify version exists
-        version_exists = any(
-            v["id"] == version_id for v in self.manifest.get("versionHistory", [])
-        )
-        if not version_exists:
+        if version_id not in self._version_index():
             return False
         
         # Initialize tags dict if not present
@@ -499,6 +889,7 @@ class JCFManager:
             return False
         
         self.manifest["refs"]["tags"][tag_name] = version_id
+        self._dirty = True
         return True
 
     def get_version_by_tag(self, tag_name: str) -> Optional[str]:
@@ -526,51 +917,65 @@ class JCFManager:
         Returns:
             Dict with 'valid' (bool), 'checked' (int), 'errors' (list of issues).
         """
-        import hashlib
-        
         if self.manifest is None:
             return {"valid": False, "checked": 0, "errors": ["No manifest loaded"]}
         
-        errors = []
-        checked = 0
-        
-        for version in self.manifest.get("versionHistory", []):
+        # Versions re-reference unchanged blobs, so hash each blob only once
+        refs: Dict[str, List[Tuple[Tuple[int, int], str, str]]] = {}
+        for pos, version in enumerate(self.manifest.get("versionHistory", [])):
             file_states = version.get("fileStates", {})
-            for path, state in file_states.items():
+            for idx, (path, state) in enumerate(file_states.items()):
                 content_ref = state.get("contentRef") or state.get("blobRef")
-                if not content_ref:
-                    continue
+                if content_ref:
+                    refs.setdefault(content_ref, []).append(((pos, idx), version["id"], path))
+        
+        def check(content_ref):
+            # Try to read the blob
+            try:
+                # Handle blob paths (stored in .store/blobs but referenced as blobs/)
+                read_path = content_ref
+                if content_ref.startswith("blobs/") and not content_ref.startswith(".store/"):
+                     read_path = f".store/{content_ref}"
                 
-                # Try to read the blob
-                try:
-                    # Handle blob paths (stored in .store/blobs but referenced as blobs/)
-                    read_path = content_ref
-                    if content_ref.startswith("blobs/") and not content_ref.startswith(".store/"):
-                         read_path = f".store/{content_ref}"
-                    
-                    blob_content = self.adapter.read(read_path)
-                    checked += 1
-                    
+                with self.adapter.open_read(read_path) as fh:
                     # Extract expected hash from blob path (e.g. .store/blobs/sha256-xxx)
-                    if "sha256-" in content_ref:
-                        expected_hash = content_ref.split("sha256-")[-1]
-                        actual_hash = hashlib.sha256(blob_content).hexdigest()
-                        
-                        if actual_hash != expected_hash:
-                            errors.append({
-                                "version": version["id"],
-                                "path": path,
-                                "expected": expected_hash[:16] + "...",
-                                "actual": actual_hash[:16] + "...",
-                                "error": "Hash mismatch"
-                            })
-                except Exception as e:
-                    errors.append({
-                        "version": version["id"],
-                        "path": path,
-                        "blob": content_ref,
-                        "error": f"Read error: {e}"
-                    })
+                    if "sha256-" not in content_ref:
+                        return True, None
+                    expected_hash = content_ref.split("sha256-")[-1]
+                    actual_hash = _sha256_hex(fh)
+                    
+                    if actual_hash != expected_hash:
+                        return True, {
+                            "expected": expected_hash[:16] + "...",
+                            "actual": actual_hash[:16] + "...",
+                            "error": "Hash mismatch"
+                        }
+                return True, None
+            except Exception as e:
+                return False, {
+                    "blob": content_ref,
+                    "error": f"Read error: {e}"
+                }
+        
+        # Reads and hashlib both release the GIL, so blobs verify in parallel
+        if len(refs) > 1:
+            with ThreadPoolExecutor() as pool:
+                results = list(pool.map(check, refs))
+        else:
+            results = [check(ref) for ref in refs]
+        
+        # Report per (version, path) reference in history and fileStates
+        # order, as before deduplication
+        failed = []
+        checked = 0
+        for occurrences, (was_read, error) in zip(refs.values(), results):
+            if was_read:
+                checked += len(occurrences)
+            if error is not None:
+                failed.extend((order, version_id, path, error) for order, version_id, path in occurrences)
+        failed.sort(key=lambda item: item[0])
+        errors = [{"version": version_id, "path": path, **error}
+                  for _, version_id, path, error in failed]
         
         return {
             "valid": len(errors) == 0,
@@ -578,10 +983,86 @@ class JCFManager:
             "errors": errors
         }
 
+    def _version_index(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Map of version id -> version entry, rebuilt only when history changes.
+        
+        versionHistory is append-only and replaced wholesale when the manifest
+        is reloaded, so the list's identity plus its length detects staleness.
+        """
+        history = self.manifest.get("versionHistory", []) if self.manifest else []
+        if history is not self._version_index_source or len(history) != self._version_index_len:
+            self._version_index_map = {v["id"]: v for v in history}
+            self._version_index_source = history
+            self._version_index_len = len(history)
+        return self._version_index_map
+
+    def _has_blob(self, path: str, size: int) -> bool:
+        """True if storage already holds a blob of this size at path."""
+        try:
+            return self.adapter.exists(path) and self.adapter.size(path) == size
+        except (NotImplementedError, OSError):
+            return False
+
+    def _materialize(self, path: Optional[str] = None) -> None:
+        """Read pending archive entries into working_dir (one path, or all)."""
+        if not self._lazy:
+            return
+        if path is None:
+            self._check_archive()
+            for file_path, name in self._lazy.items():
+                self.working_dir[file_path] = self._archive.read(name)
+            self._lazy.clear()
+        else:
+            if path not in self._lazy:
+                return
+            self._check_archive()
+            self.working_dir[path] = self._archive.read(self._lazy.pop(path))
+        if not self._lazy:
+            self._close_archive()
+
+    def _check_archive(self) -> None:
+        """Refuse to read lazy entries once the loaded archive was rewritten."""
+        if self._archive_token is None:
+            return
+        if self.adapter.stat_token(self._archive_path) != self._archive_token:
+            raise RuntimeError(
+                f"{self._archive_path} changed since it was loaded; "
+                "load() it again to read its remaining content"
+            )
+
+    def _close_archive(self) -> None:
+        """Drop the archive kept open by load() along with any unread entries."""
+        self._lazy = {}
+        self._archive_path = self._archive_token = None
+        if self._archive is not None:
+            self._archive.close()
+            self._archive_fh.close()
+            self._archive = self._archive_fh = None
+
+    def _file_history_index(self) -> Dict[str, List[Tuple[int, Optional[str]]]]:
+        """
+        Map of path -> [(position in versionHistory, blob ref)] for versions containing it.
+        
+        Same staleness check as _version_index; when history only grew, just
+        the new versions are scanned.
+        """
+        history = self.manifest.get("versionHistory", []) if self.manifest else []
+        if history is not self._file_history_source or len(history) < self._file_history_len:
+            self._file_history_map = {}
+            self._file_history_source = history
+            self._file_history_len = 0
+        index = self._file_history_map
+        for pos in range(self._file_history_len, len(history)):
+            for path, state in history[pos].get("fileStates", {}).items():
+                index.setdefault(path, []).append((pos, state.get("contentRef") or state.get("blobRef")))
+        self._file_history_len = len(history)
+        return index
+
     def _is_text_file(self, path: str) -> bool:
         """Check if file is text based on extension."""
-        text_extensions = ['.txt', '.md', '.json', '.js', '.ts', '.css', '.html', '.xml', '.yaml', '.yml', '.py']
-        return any(path.lower().endswith(ext) for ext in text_extensions)
+        i = path.rfind('.')
+        return i != -1 and path[i + 1:].lower() in _TEXT_EXTS
 
 
 class StorageAdapter:
@@ -589,10 +1070,60 @@ class StorageAdapter:
     
     def read(self, path: str) -> bytes:
         raise NotImplementedError
+
+    def lock(self) -> ContextManager[None]:
+        """Exclusive lock around manifest read-modify-write (no-op by default)."""
+        return contextlib.nullcontext()
+
+    def stat_token(self, path: str) -> Optional[Any]:
+        """
+        Cheap value that changes whenever the file at path is rewritten.
+        
+        None means "unknown" (callers must re-read); this is the default.
+        """
+        return None
+
+    def open_read(self, path: str) -> BinaryIO:
+        """Open a file as a seekable binary stream (defaults to read())."""
+        return io.BytesIO(self.read(path))
+    
+    def open_archive(self, path: str) -> BinaryIO:
+        """
+        Open a .jcf for load(), which keeps it open while content is lazy.
+        
+        The stream may outlive later writes to path, so it must not fault if
+        the file changes underneath it (defaults to open_read()).
+        """
+        return self.open_read(path)
+    
+    def read_many(self, paths: Iterable[str]) -> Dict[str, bytes]:
+        """Read several files; adapters may batch these (defaults to read() each)."""
+        return {path: self.read(path) for path in paths}
     
     def write(self, path: str, data: bytes) -> None:
         raise NotImplementedError
     
+    @contextlib.contextmanager
+    def open_write(self, path: str) -> Iterator[BinaryIO]:
+        """
+        Context manager yielding a writable stream for path.
+        
+        The file is only published if the block exits cleanly. Defaults to
+        buffering in memory and calling write() at the end.
+        """
+        buffer = io.BytesIO()
+        yield buffer
+        self.write(path, buffer.getvalue())
+    
+    def write_many(self, items: Iterable[Tuple[str, bytes]]) -> None:
+        """Write several files; adapters may batch these (defaults to write() each)."""
+        for path, data in items:
+            self.write(path, data)
+    
+    def copy(self, src: str, dst: str) -> None:
+        """Copy a file within the storage (defaults to read() + write())."""
+        self.write(dst, self.read(src))
+    
     def delete(self, path: str) -> None:
         raise NotImplementedError
     
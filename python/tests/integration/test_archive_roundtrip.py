@@ -0,0 +1,246 @@
+import hashlib
+import json
+import os
+import zipfile
+
+import pytest
+
+import kamaros.manager as manager_module
+from kamaros import FileAdapter, JCFManager
+
+def test_save_load_roundtrip_file_adapter(tmp_path):
+    """Integration test: archive written by save() is read back by load()."""
+    origin = JCFManager(FileAdapter(str(tmp_path / "origin")))
+    origin.create_project("RoundTrip")
+    origin.add_file("README.md", b"# Hello")
+    origin.add_file("images/pic.bin", b"\x00\x01\x02")
+    origin.save("project.jcf")
+    
+    loaded = JCFManager(FileAdapter(str(tmp_path / "origin")))
+    loaded.load("project.jcf")
+    
+    assert loaded.manifest["metadata"]["name"] == "RoundTrip"
+    assert sorted(loaded.list_files()) == ["README.md", "images/pic.bin"]
+    assert loaded.get_file("images/pic.bin") == b"\x00\x01\x02"
+
+def _stale_store_archive(tmp_path):
+    """A .jcf whose .store/manifest.json predates a tag and a rename."""
+    m = JCFManager(FileAdapter(str(tmp_path / "src")))
+    m.create_project("LoadProject")
+    m.add_file("a.txt", b"a")
+    m.manifest["versionHistory"].append({"id": "v1", "fileStates": {}})
+    m._persist_manifest()
+    m.tag_version("v1", "release")
+    m.rename_file("a.txt", "c.txt")
+    m.save("p.jcf")
+    return (tmp_path / "src" / "p.jcf").read_bytes()
+
+def test_checkpoint_after_load_keeps_loaded_manifest(tmp_path):
+    """Integration test: load() makes the loaded manifest the stored one, so no stale rebase."""
+    adapter = FileAdapter(str(tmp_path / "dst"))
+    adapter.write("p.jcf", _stale_store_archive(tmp_path))
+    m = JCFManager(adapter)
+    m.load("p.jcf")
+    with adapter.lock():
+        m._merge_stored_manifest()
+    
+    assert m.manifest["refs"]["tags"] == {"release": "v1"}
+    assert [(r["from"], r["to"]) for r in m.manifest["renameLog"]] == [("a.txt", "c.txt")]
+    assert list(m.manifest["fileMap"]) == ["c.txt"]
+
+def test_rebase_replays_local_tags_and_renames(tmp_path):
+    """Integration test: a rebase onto another manager's checkpoint keeps our tag, rename and fileMap edits."""
+    adapter = FileAdapter(str(tmp_path / "dst"))
+    adapter.write("p.jcf", _stale_store_archive(tmp_path))
+    m = JCFManager(adapter)
+    m.load("p.jcf")
+    other = JCFManager(adapter)
+    other.load_manifest()
+    
+    m.tag_version("v1", "local-tag")
+    m.rename_file("c.txt", "d.txt")
+    other.manifest["versionHistory"].append({"id": "v2", "fileStates": {}})
+    other.manifest["refs"]["head"] = "v2"
+    other._persist_manifest()
+    with adapter.lock():
+        m._merge_stored_manifest()
+    
+    assert m.manifest["refs"]["head"] == "v2"
+    assert m.manifest["refs"]["tags"] == {"release": "v1", "local-tag": "v1"}
+    assert [r["to"] for r in m.manifest["renameLog"]] == ["c.txt", "d.txt"]
+    assert list(m.manifest["fileMap"]) == ["d.txt"]
+
+def test_save_stores_precompressed_entries(tmp_path):
+    """Integration test: already-compressed formats are stored, everything else deflated."""
+    manager = JCFManager(FileAdapter(str(tmp_path)))
+    manager.create_project("Album")
+    manager.add_file("photos/a.JPG", b"\xff\xd8" * 100)
+    manager.add_file("README.md", b"# Album\n" * 100)
+    manager.save("album.jcf")
+    
+    with zipfile.ZipFile(tmp_path / "album.jcf") as zf:
+        assert zf.getinfo("content/photos/a.JPG").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("content/README.md").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.read("content/photos/a.JPG") == b"\xff\xd8" * 100
+
+def test_load_reads_content_on_demand(tmp_path):
+    """Integration test: load() defers content/ reads until a file is accessed."""
+    origin = JCFManager(FileAdapter(str(tmp_path)))
+    origin.create_project("Lazy")
+    origin.add_files({"a.txt": b"A", "b.txt": b"B", "c.txt": b"C"})
+    origin.save("lazy.jcf")
+    
+    loaded = JCFManager(FileAdapter(str(tmp_path)))
+    loaded.load("lazy.jcf")
+    assert loaded.working_dir == {}
+    assert sorted(loaded.list_files()) == ["a.txt", "b.txt", "c.txt"]
+    
+    assert loaded.get_file("a.txt") == b"A"
+    assert loaded.working_dir == {"a.txt": b"A"}
+    assert loaded.delete_file("b.txt") is True
+    
+    # Unread entries are read in before the loaded archive is replaced
+    loaded.save("lazy.jcf")
+    assert loaded._archive is None
+    again = JCFManager(FileAdapter(str(tmp_path)))
+    again.load("lazy.jcf")
+    assert again.get_files(["a.txt", "b.txt", "c.txt"]) == {"a.txt": b"A", "b.txt": None, "c.txt": b"C"}
+    assert again._archive is None
+
+def test_lazy_archive_survives_rewrites_of_its_file(tmp_path):
+    """Integration test: lazy entries never read through a mapping of the loaded file."""
+    adapter = FileAdapter(str(tmp_path))
+    origin = JCFManager(adapter)
+    origin.create_project("Lazy")
+    # incompressible padding keeps a.txt out of the handle's read buffer
+    origin.add_files({"b.txt": os.urandom(1 << 16), "a.txt": b"A"})
+    origin.save("lazy.jcf")
+    
+    loaded = JCFManager(adapter)
+    loaded.load("lazy.jcf")
+    # Unread entries are copied from the still-open archive
+    loaded.save("copy.jcf")
+    assert loaded._archive is not None
+    # ...but read in before the loaded archive itself is replaced
+    loaded.save("lazy.jcf")
+    assert loaded._archive is None
+    
+    loaded.load("lazy.jcf")
+    loaded.add_files({"a.txt": b"A2", "b.txt": b"B2"})
+    assert loaded._archive is None
+    
+    loaded.load("lazy.jcf")
+    adapter.write("lazy.jcf", b"")  # truncates in place
+    with pytest.raises(RuntimeError, match="changed since it was loaded"):
+        loaded.get_file("a.txt")
+
+def test_failed_load_keeps_current_project(tmp_path):
+    """Integration test: load() of a missing archive leaves the loaded one intact."""
+    adapter = FileAdapter(str(tmp_path))
+    origin = JCFManager(adapter)
+    origin.create_project("Lazy")
+    origin.add_files({"a.txt": b"A"})
+    origin.save("a.jcf")
+    
+    loaded = JCFManager(adapter)
+    loaded.load("a.jcf")
+    with pytest.raises(FileNotFoundError):
+        loaded.load("missing.jcf")
+    
+    assert loaded.list_files() == ["a.txt"]
+    assert loaded.get_files(path for path in ["a.txt"]) == {"a.txt": b"A"}
+
+def test_load_skips_blobs_already_in_storage(tmp_path):
+    """Integration test: load() does not re-extract blobs the adapter already holds."""
+    adapter = FileAdapter(str(tmp_path))
+    manager = JCFManager(adapter)
+    manager.create_project("Blobs")
+    adapter.write(".store/blobs/abc", b"blob")
+    adapter.write(".store/blobs/def", b"other")
+    manager.save("p.jcf")
+    
+    adapter.delete(".store/blobs/def")
+    writes = []
+    original = adapter.write_many
+    adapter.write_many = lambda items: writes.extend(items) or original(writes)
+    
+    manager.load("p.jcf")
+    
+    # the manifest is persisted from the archive's manifest.json, not extracted
+    assert [name for name, _ in writes] == [".store/blobs/def"]
+    assert json.loads(adapter.read(".store/manifest.json")) == manager.manifest
+    assert adapter.read(".store/blobs/abc") == b"blob"
+    assert adapter.read(".store/blobs/def") == b"other"
+
+def test_load_streams_large_store_entries(tmp_path, monkeypatch):
+    """Integration test: store entries over the stream threshold bypass write_many."""
+    monkeypatch.setattr(manager_module, "_STREAM_THRESHOLD", 16)
+    adapter = FileAdapter(str(tmp_path / "src"))
+    manager = JCFManager(adapter)
+    manager.create_project("Stream")
+    adapter.write(".store/blobs/big", b"x" * 100)
+    manager.save("p.jcf")
+    
+    target = FileAdapter(str(tmp_path / "dst"))
+    target.write("p.jcf", adapter.read("p.jcf"))
+    batched = []
+    original = target.write_many
+    target.write_many = lambda items: original(batched.extend(items) or batched)
+    JCFManager(target).load("p.jcf")
+    
+    assert ".store/blobs/big" not in [name for name, _ in batched]
+    assert target.read(".store/blobs/big") == b"x" * 100
+
+def test_load_writes_store_entries_in_batches(tmp_path, monkeypatch):
+    """Integration test: load() flushes small store entries to write_many in bounded batches."""
+    monkeypatch.setattr(manager_module, "_WRITE_BATCH_COUNT", 2)
+    adapter = FileAdapter(str(tmp_path / "src"))
+    manager = JCFManager(adapter)
+    manager.create_project("Batches")
+    for name in "abcde":
+        adapter.write(f".store/blobs/{name}", name.encode())
+    manager.save("p.jcf")
+    
+    target = FileAdapter(str(tmp_path / "dst"))
+    target.write("p.jcf", adapter.read("p.jcf"))
+    batches = []
+    original = target.write_many
+    target.write_many = lambda items: batches.append(len(items)) or original(items)
+    JCFManager(target).load("p.jcf")
+    
+    assert batches == [2, 2, 1]
+    for name in "abcde":
+        assert target.read(f".store/blobs/{name}") == name.encode()
+
+def test_save_streams_large_store_blobs(tmp_path, monkeypatch):
+    """Integration test: large store blobs are copied into the archive in chunks."""
+    monkeypatch.setattr(manager_module, "_STREAM_THRESHOLD", 64)
+    monkeypatch.setattr(manager_module, "_STREAM_CHUNK", 32)
+    adapter = FileAdapter(str(tmp_path))
+    manager = JCFManager(adapter)
+    manager.create_project("Chunks")
+    text = b"line of text\n" * 20
+    png = b"\x89PNG" + bytes(range(200))
+    adapter.write(".store/blobs/text", text)
+    adapter.write(".store/blobs/png", png)
+    manager.save("p.jcf")
+    
+    with zipfile.ZipFile(tmp_path / "p.jcf") as zf:
+        assert zf.read(".store/blobs/text") == text
+        assert zf.read(".store/blobs/png") == png
+        assert zf.getinfo(".store/blobs/text").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo(".store/blobs/png").compress_type == zipfile.ZIP_STORED
+
+def test_verify_integrity_hashes_mapped_files_in_chunks(tmp_path, monkeypatch):
+    """Integration test: FileAdapter blobs are hashed through open_read in small chunks."""
+    monkeypatch.setattr(manager_module, "_STREAM_CHUNK", 7)
+    manager = JCFManager(FileAdapter(str(tmp_path)))
+    manager.create_project("Chunked")
+    blob = bytes(range(256)) * 3
+    digest = hashlib.sha256(blob).hexdigest()
+    manager.adapter.write(f".store/blobs/sha256-{digest}", blob)
+    manager.manifest["versionHistory"] = [
+        {"id": "v1", "fileStates": {"a.bin": {"blobRef": f"blobs/sha256-{digest}"}}},
+    ]
+    
+    assert manager.verify_integrity() == {"valid": True, "checked": 1, "errors": []}
@@ -117,6 +117,32 @@ class TestMemoryAdapterEdgeCases:
         
         assert files == []
 
+    def test_list_blobs_tracks_writes_and_deletes(self):
+        """Test: list_blobs reflects blob writes, deletes and clear"""
+        adapter = MemoryAdapter()
+        adapter.write(".store/blobs/aaa", b"a")
+        adapter.write(".store/blobs/bbb", b"b")
+        adapter.write(".store/manifest.json", b"{}")
+        
+        adapter.delete(".store/blobs/aaa")
+        
+        assert adapter.list_blobs() == ["bbb"]
+        adapter.clear()
+        assert adapter.list_blobs() == []
+
+    def test_write_many(self):
+        """Test: write_many stores every item and indexes blobs"""
+        adapter = MemoryAdapter()
+        adapter.write_many([
+            (".store/blobs/aaa", b"a"),
+            ("content/a.txt", b"text"),
+        ])
+        
+        assert adapter.read(".store/blobs/aaa") == b"a"
+        assert adapter.read("content/a.txt") == b"text"
+        assert adapter.list_blobs() == ["aaa"]
+        assert adapter.stat_token("content/a.txt") is not None
+
 
 class TestFileAdapter:
     """Tests for FileAdapter (with real filesystem)"""
@@ -169,3 +195,138 @@ class TestFileAdapter:
             adapter.write("a/b/c/deep.txt", b"content")
             
             assert adapter.exists("a/b/c/deep.txt") is True
+
+    def test_open_read_is_seekable_stream(self):
+        """Test: open_read returns a seekable stream over file content"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            adapter.write("archive.bin", b"0123456789")
+            
+            with adapter.open_read("archive.bin") as fh:
+                fh.seek(4)
+                assert fh.read(3) == b"456"
+                assert fh.tell() == 7
+
+    def test_list_blobs(self):
+        """Test: list_blobs returns blob names only, empty without a store"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            assert adapter.list_blobs() == []
+            
+            adapter.write(".store/blobs/aaa", b"1")
+            adapter.write(".store/blobs/bbb", b"2")
+            adapter.write(".store/blobs/sub/ccc", b"3")
+            
+            assert sorted(adapter.list_blobs()) == ["aaa", "bbb"]
+
+    def test_lock_is_exclusive(self):
+        """Test: lock() serializes critical sections across adapter instances"""
+        import threading
+        import time
+        with tempfile.TemporaryDirectory() as tmpdir:
+            inside = []
+            overlaps = []
+            
+            def critical(adapter):
+                with adapter.lock():
+                    inside.append(1)
+                    if len(inside) > 1:
+                        overlaps.append(1)
+                    time.sleep(0.01)
+                    inside.pop()
+            
+            # Separate instances only share the flock on .store/manifest.lock
+            threads = [threading.Thread(target=critical, args=(FileAdapter(tmpdir),)) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            
+            assert overlaps == []
+
+    def test_copy(self):
+        """Test: copy duplicates content into a new nested path"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            adapter.write(".store/blobs/abc", b"blob content")
+            
+            adapter.copy(".store/blobs/abc", "content/dir/file.bin")
+            
+            assert adapter.read("content/dir/file.bin") == b"blob content"
+            assert adapter.read(".store/blobs/abc") == b"blob content"
+
+    def test_blob_write_is_idempotent(self):
+        """Test: rewriting an existing blob keeps it and leaves no temp files"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            
+            adapter.write(".store/blobs/abc", b"same bytes")
+            adapter.write(".store/blobs/abc", b"same bytes")
+            
+            assert adapter.read(".store/blobs/abc") == b"same bytes"
+            assert os.listdir(os.path.join(tmpdir, ".store", "blobs")) == ["abc"]
+
+    def test_blob_write_replaces_torn_blob(self):
+        """Test: writing a blob over a truncated copy replaces it"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            
+            adapter.write(".store/blobs/abc", b"full blob")
+            with open(os.path.join(tmpdir, ".store", "blobs", "abc"), "r+b") as f:
+                f.truncate(4)
+            adapter.write(".store/blobs/abc", b"full blob")
+            
+            assert adapter.read(".store/blobs/abc") == b"full blob"
+            assert os.listdir(os.path.join(tmpdir, ".store", "blobs")) == ["abc"]
+
+    def test_stat_token_changes_on_rewrite(self):
+        """Test: stat_token is None for missing files and changes when content changes"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            assert adapter.stat_token("manifest.json") is None
+            
+            adapter.write("manifest.json", b"{}")
+            first = adapter.stat_token("manifest.json")
+            assert first == adapter.stat_token("manifest.json")
+            
+            adapter.write("manifest.json", b'{"a": 1}')
+            assert adapter.stat_token("manifest.json") != first
+
+    def test_write_many(self):
+        """Test: write_many writes every item, creating nested directories"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            items = [(f".store/blobs/{i:04x}", bytes([i]) * 10) for i in range(20)]
+            items.append(("content/a/b.txt", b"text"))
+            
+            adapter.write_many(items)
+            
+            for path, data in items:
+                assert adapter.read(path) == data
+
+    def test_read_many(self):
+        """Test: read_many returns every requested file and raises on a missing one"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            items = [(f"content/f{i}.txt", str(i).encode()) for i in range(10)]
+            adapter.write_many(items)
+            
+            assert adapter.read_many(path for path, _ in items) == dict(items)
+            with pytest.raises(FileNotFoundError):
+                adapter.read_many(["content/f0.txt", "content/missing.txt"])
+
+    def test_open_write_replaces_only_on_success(self):
+        """Test: open_write publishes on clean exit and keeps the old file on error"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            adapter = FileAdapter(tmpdir)
+            with adapter.open_write("out/archive.jcf") as fh:
+                fh.write(b"first")
+            assert adapter.read("out/archive.jcf") == b"first"
+            
+            with pytest.raises(RuntimeError):
+                with adapter.open_write("out/archive.jcf") as fh:
+                    fh.write(b"partial")
+                    raise RuntimeError("boom")
+            
+            assert adapter.read("out/archive.jcf") == b"first"
+            assert os.listdir(os.path.join(tmpdir, "out")) == ["archive.jcf"]
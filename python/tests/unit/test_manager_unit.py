@@ -1,5 +1,13 @@
+import hashlib
+import io
+import json
+import zipfile
+from types import MappingProxyType
+
 import pytest
+
 from kamaros import JCFManager, MemoryAdapter
+from kamaros.manager import _blob_compression, _dumps_manifest, _loads_manifest
 
 @pytest.fixture
 def manager():
@@ -35,6 +43,39 @@ def test_add_file_validation(manager):
     manager.add_file("subdir/deep/test.txt", b"Deep")
     assert manager.get_file("subdir/deep/test.txt") == b"Deep"
 
+def test_add_files_batch(manager):
+    """Unit test for adding and reading several files in one call."""
+    manager.create_project("BatchProject")
+    manager.add_files({"a.txt": b"A", "img/b.bin": b"\x00\x01"})
+    
+    assert manager.get_files(["a.txt", "img/b.bin", "missing.txt"]) == {
+        "a.txt": b"A",
+        "img/b.bin": b"\x00\x01",
+        "missing.txt": None,
+    }
+    file_map = manager.manifest["fileMap"]
+    assert file_map["a.txt"]["type"] == "text"
+    assert file_map["img/b.bin"]["type"] == "binary"
+    assert file_map["a.txt"]["modified"] == file_map["img/b.bin"]["modified"]
+
+def test_add_files_from_pairs(manager):
+    """Unit test: add_files takes an iterable of (path, content) pairs."""
+    manager.create_project("PairsProject")
+    manager.add_files((f"f{i}.txt", str(i).encode()) for i in range(3))
+    
+    assert manager.get_files(["f0.txt", "f2.txt"]) == {"f0.txt": b"0", "f2.txt": b"2"}
+    assert sorted(manager.manifest["fileMap"]) == ["f0.txt", "f1.txt", "f2.txt"]
+
+def test_add_files_accepts_mappings_and_checks_content(manager):
+    """Unit test: any Mapping is read as path -> content; non-bytes content is rejected."""
+    manager.create_project("MappingProject")
+    manager.add_files(MappingProxyType({"xy": b"zz"}))
+    assert manager.list_files() == ["xy"]
+    
+    with pytest.raises(TypeError):
+        manager.add_files([("a.txt", b"A"), ("b.txt", "text")])
+    assert manager.list_files() == ["xy"]
+
 def test_roadmap_tag_logic(manager):
     """Unit test for tag validation logic."""
     manager.create_project("TagLogic")
@@ -49,3 +90,276 @@ def test_roadmap_tag_logic(manager):
     
     # Duplicate tag should fail
     assert manager.tag_version(v1, "release") == False
+
+def test_verify_integrity_reports_bad_blobs(manager):
+    """Unit test for verify_integrity over hand-built version history."""
+    manager.create_project("VerifyProject")
+    good = b"good blob"
+    good_hash = hashlib.sha256(good).hexdigest()
+    manager.adapter.write(f".store/blobs/sha256-{good_hash}", good)
+    manager.adapter.write(f".store/blobs/sha256-{'0' * 64}", b"tampered")
+    manager.manifest["versionHistory"] = [{
+        "id": "v1",
+        "fileStates": {
+            "a.bin": {"blobRef": f"blobs/sha256-{good_hash}"},
+            "b.bin": {"blobRef": f"blobs/sha256-{'0' * 64}"},
+            "c.bin": {"blobRef": "blobs/sha256-missing"},
+            "d.txt": {},
+        },
+    }]
+    
+    result = manager.verify_integrity()
+    
+    assert result["valid"] is False
+    assert result["checked"] == 2
+    assert [e["path"] for e in result["errors"]] == ["b.bin", "c.bin"]
+    assert result["errors"][0]["error"] == "Hash mismatch"
+    assert result["errors"][1]["error"].startswith("Read error")
+
+def test_verify_integrity_hashes_shared_blobs_once(manager):
+    """A blob referenced by several versions is read once, reported per reference."""
+    manager.create_project("VerifySharedProject")
+    bad_ref = f".store/blobs/sha256-{'0' * 64}"
+    manager.adapter.write(bad_ref, b"tampered")
+    manager.manifest["versionHistory"] = [
+        {"id": "v1", "fileStates": {"a.bin": {"contentRef": bad_ref}}},
+        {"id": "v2", "fileStates": {"a.bin": {"contentRef": bad_ref}}},
+    ]
+    opened = []
+    open_read = manager.adapter.open_read
+    manager.adapter.open_read = lambda path: opened.append(path) or open_read(path)
+    
+    result = manager.verify_integrity()
+    
+    assert opened == [bad_ref]
+    assert result["checked"] == 2
+    assert [(e["version"], e["path"]) for e in result["errors"]] == [("v1", "a.bin"), ("v2", "a.bin")]
+
+def test_verify_integrity_reports_errors_in_history_order(manager):
+    """Errors come out by version position, then fileStates order, not grouped per blob."""
+    manager.create_project("VerifyOrderProject")
+    bad_a, bad_b = (f".store/blobs/sha256-{c * 64}" for c in "01")
+    manager.adapter.write(bad_a, b"tampered a")
+    manager.adapter.write(bad_b, b"tampered b")
+    manager.manifest["versionHistory"] = [
+        {"id": "v1", "fileStates": {"a": {"contentRef": bad_a}}},
+        {"id": "v2", "fileStates": {"b": {"contentRef": bad_b}, "a": {"contentRef": bad_a}}},
+    ]
+    
+    errors = manager.verify_integrity()["errors"]
+    
+    assert [(e["version"], e["path"]) for e in errors] == [("v1", "a"), ("v2", "b"), ("v2", "a")]
+
+def test_checkpoint_rebases_on_stored_manifest():
+    """Unit test: a stale manager picks up history written by another manager."""
+    adapter = MemoryAdapter()
+    m1 = JCFManager(adapter)
+    m1.create_project("SharedProject")
+    m2 = JCFManager(adapter)
+    m2.load_manifest()
+    
+    # Simulate m1 checkpointing behind m2's back
+    m1.manifest["versionHistory"].append({"id": "v1", "fileStates": {}})
+    m1.manifest["refs"]["head"] = "v1"
+    m1.manifest["fileMap"]["m1.txt"] = {"inodeId": "i1", "type": "text"}
+    adapter.write(".store/manifest.json", json.dumps(m1.manifest).encode("utf-8"))
+    
+    m2.add_file("m2.txt", b"m2")
+    with adapter.lock():
+        m2._merge_stored_manifest()
+    
+    assert m2.manifest["refs"]["head"] == "v1"
+    assert set(m2.manifest["fileMap"]) == {"m1.txt", "m2.txt"}
+
+def test_get_file_at_version_cache():
+    """Unit test for the byte-bounded LRU behind get_file_at_version."""
+    manager = JCFManager(MemoryAdapter(), cache_size=10)
+    manager.create_project("CacheProject")
+    manager.adapter.write(".store/blobs/a", b"aaaaaa")
+    manager.adapter.write(".store/blobs/b", b"bbbbbb")
+    manager.manifest["versionHistory"] = [{
+        "id": "v1",
+        "fileStates": {"a.txt": {"blobRef": "blobs/a"}, "b.txt": {"blobRef": "blobs/b"}},
+    }]
+    
+    assert manager.get_file_at_version("a.txt", "v1") == b"aaaaaa"
+    assert manager.get_file_at_version("a.txt", "v1") == b"aaaaaa"
+    stats = manager.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["bytes"]) == (1, 1, 6)
+    
+    # Second blob does not fit next to the first one: "a" is evicted
+    assert manager.get_file_at_version("b.txt", "v1") == b"bbbbbb"
+    assert manager.cache_stats()["entries"] == 1
+    assert manager.get_file_at_version("a.txt", "v1") == b"aaaaaa"
+    assert manager.cache_stats()["misses"] == 3
+
+def test_add_file_stream(manager):
+    """Unit test for adding files from a file object and from a chunk iterator."""
+    manager.create_project("StreamProject")
+    payload = bytes(range(256)) * 1024
+    
+    manager.add_file_stream("from_file.bin", io.BytesIO(payload), chunk_size=1000)
+    manager.add_file_stream("from_chunks.txt", iter([b"ab", b"", b"cd"]))
+    
+    assert manager.get_file("from_file.bin") == payload
+    assert manager.get_file("from_chunks.txt") == b"abcd"
+    assert manager.manifest["fileMap"]["from_chunks.txt"]["type"] == "text"
+
+def test_add_file_stream_rejects_text_chunks(manager):
+    """Unit test: a text-mode stream raises TypeError instead of looping forever."""
+    manager.create_project("StreamProject")
+    
+    with pytest.raises(TypeError):
+        manager.add_file_stream("a.txt", io.StringIO("text"))
+    with pytest.raises(TypeError):
+        manager.add_file_stream("b.txt", iter(["text"]))
+    assert manager.list_files() == []
+
+def test_version_index_tracks_history(manager):
+    """Unit test: tag_version sees versions appended or reloaded after first use."""
+    manager.create_project("IndexProject")
+    assert manager.tag_version("v1", "first") is False
+    
+    manager.manifest["versionHistory"].append({"id": "v1", "fileStates": {}})
+    assert manager.tag_version("v1", "first") is True
+    
+    manager.manifest = dict(manager.manifest, versionHistory=[{"id": "v2", "fileStates": {}}])
+    assert manager.tag_version("v1", "again") is False
+    assert manager.tag_version("v2", "second") is True
+    assert manager.get_version_by_tag("second") == "v2"
+
+def test_merge_skips_reparse_when_manifest_unchanged(monkeypatch):
+    """Unit test: rebasing only re-reads the stored manifest after someone else wrote it."""
+    adapter = MemoryAdapter()
+    manager = JCFManager(adapter)
+    manager.create_project("TokenProject")
+    manager.add_file("local.txt", b"x")
+    
+    reads = []
+    original_read = adapter.read
+    monkeypatch.setattr(adapter, "read", lambda path: reads.append(path) or original_read(path))
+    
+    manager._merge_stored_manifest()
+    assert reads == []
+    assert "local.txt" in manager.manifest["fileMap"]
+    
+    other = JCFManager(adapter)
+    other.load_manifest()
+    other.manifest["refs"]["head"] = "v-other"
+    other._persist_manifest()
+    
+    manager._merge_stored_manifest()
+    assert manager.manifest["refs"]["head"] == "v-other"
+    assert "local.txt" in manager.manifest["fileMap"]
+
+def test_manifest_json_helpers_roundtrip():
+    """Unit test: manifest helpers emit compact (or indented) UTF-8 JSON readable by stdlib json."""
+    manifest = {"metadata": {"name": "Zażółć"}, "fileMap": {}, "versionHistory": []}
+    
+    data = _dumps_manifest(manifest)
+    pretty = _dumps_manifest(manifest, pretty=True)
+    
+    assert isinstance(data, bytes)
+    assert b"\n" not in data and b'"fileMap":{}' in data
+    assert "Zażółć".encode("utf-8") in data
+    assert b'\n  "metadata"' in pretty
+    assert json.loads(data.decode("utf-8")) == manifest
+    assert _loads_manifest(data) == manifest == _loads_manifest(pretty)
+
+def test_is_text_file_by_extension(manager):
+    """Unit test: text detection looks only at the last suffix, case-insensitively."""
+    assert manager._is_text_file("docs/README.MD")
+    assert manager._is_text_file("a.b/config.yml")
+    assert not manager._is_text_file("notes.txt.gz")
+    assert not manager._is_text_file("Makefile")
+    assert not manager._is_text_file("dir.txt/blob")
+
+def test_add_file_skips_identical_content(manager):
+    """Unit test: re-adding byte-identical content leaves the fileMap entry untouched."""
+    manager.create_project("SameContent")
+    manager.add_file("a.txt", b"same")
+    manager.manifest["fileMap"]["a.txt"]["modified"] = "earlier"
+    
+    manager.add_file("a.txt", bytes(b"same"))
+    assert manager.manifest["fileMap"]["a.txt"]["modified"] == "earlier"
+    
+    manager.add_file("a.txt", b"changed")
+    assert manager.manifest["fileMap"]["a.txt"]["modified"] != "earlier"
+    assert manager.get_file("a.txt") == b"changed"
+
+def test_blob_compression_sniffs_content():
+    """Unit test: store blobs holding compressed formats are stored, others deflated."""
+    assert _blob_compression(b"\xff\xd8\xff\xe0JFIF") == zipfile.ZIP_STORED
+    assert _blob_compression(b"\x89PNG\r\n\x1a\n") == zipfile.ZIP_STORED
+    assert _blob_compression(b"\x00\x00\x00\x18ftypmp42") == zipfile.ZIP_STORED
+    assert _blob_compression(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == zipfile.ZIP_STORED
+    assert _blob_compression(b"# README") == zipfile.ZIP_DEFLATED
+    assert _blob_compression(b"") == zipfile.ZIP_DEFLATED
+
+def test_get_file_history_from_index(manager):
+    """Unit test: file history reports create/modify/delete and follows appended versions."""
+    manager.create_project("History")
+    states = [{"a.txt": "b1"}, {"a.txt": "b1"}, {"a.txt": "b2"}, {}, {"a.txt": "b3"}]
+    manager.manifest["versionHistory"] = [
+        {"id": f"v{i}", "fileStates": {p: {"contentRef": ref} for p, ref in fs.items()}}
+        for i, fs in enumerate(states)
+    ]
+    
+    actions = [(h["version_id"], h["action"]) for h in manager.get_file_history("a.txt")]
+    assert actions == [("v0", "created"), ("v2", "modified"), ("v3", "deleted"), ("v4", "created")]
+    
+    manager.manifest["versionHistory"].append({"id": "v5", "fileStates": {}})
+    assert manager.get_file_history("a.txt")[-1]["action"] == "deleted"
+    assert manager.get_file_history("missing.txt") == []
+
+def test_save_skips_unchanged_archive(manager):
+    """Unit test: re-saving an unchanged project to the same archive is a no-op unless forced."""
+    adapter = manager.adapter
+    manager.create_project("NoOp")
+    manager.add_file("a.txt", b"A")
+    manager.save("p.jcf")
+    token = adapter.stat_token("p.jcf")
+    
+    manager.save("p.jcf")
+    assert adapter.stat_token("p.jcf") == token
+    
+    manager.save("p.jcf", force=True)
+    assert adapter.stat_token("p.jcf") != token
+    token = adapter.stat_token("p.jcf")
+    
+    manager.save("p.jcf", pretty=True)
+    assert adapter.stat_token("p.jcf") != token
+    with zipfile.ZipFile(io.BytesIO(adapter.read("p.jcf"))) as zf:
+        assert zf.read("manifest.json").startswith(b"{\n")
+    token = adapter.stat_token("p.jcf")
+    manager.save("p.jcf", pretty=True)
+    assert adapter.stat_token("p.jcf") == token
+    
+    manager.add_file("a.txt", b"changed")
+    manager.save("p.jcf")
+    assert adapter.stat_token("p.jcf") != token
+    
+    loaded = JCFManager(adapter)
+    loaded.load("p.jcf")
+    token = adapter.stat_token("p.jcf")
+    loaded.save("p.jcf")
+    assert adapter.stat_token("p.jcf") == token
+    loaded.save("copy.jcf")
+    assert adapter.exists("copy.jcf")
+
+def test_compare_versions(manager):
+    """Unit test: compare_versions splits paths into added/removed/modified/unchanged."""
+    manager.create_project("Compare")
+    manager.manifest["versionHistory"] = [
+        {"id": "v1", "fileStates": {"same": {"contentRef": "b1"}, "edit": {"contentRef": "b2"},
+                                    "gone": {"contentRef": "b3"}}},
+        {"id": "v2", "fileStates": {"same": {"contentRef": "b1"}, "edit": {"blobRef": "b9"},
+                                    "new": {"contentRef": "b4"}}},
+    ]
+    
+    diff = manager.compare_versions("v1", "v2")
+    
+    assert (diff["added"], diff["removed"], diff["modified"], diff["unchanged"]) == (
+        ["new"], ["gone"], ["edit"], ["same"])
+    assert diff["summary"] == "+1 -1 ~1 =1"
+    assert manager.compare_versions("v1", "nope") == {"error": "Version not found"}